@@ -4,6 +4,7 @@ MongoDB connection and session management
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo import MongoClient, ASCENDING, DESCENDING
 from contextlib import contextmanager
+import threading
 from typing import Generator
 from config import settings
 from config.logging_config import get_logger
@@ -11,8 +12,10 @@ from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 # Synchronous MongoDB client (for scripts and sync operations)
+# One pooled client per process, shared by every caller and worker thread
 _sync_client = None
 _sync_db = None
+_sync_lock = threading.Lock()
 
 # Async MongoDB client (for FastAPI async operations)
 _async_client = None
@@ -20,24 +23,26 @@ _async_db = None
 
 
 def get_sync_client() -> MongoClient:
-    """Get synchronous MongoDB client"""
+    """Get synchronous MongoDB client (created once, thread-safe)"""
     global _sync_client
     if _sync_client is None:
-        _sync_client = MongoClient(
-            settings.MONGODB_URL,
-            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
-            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
-            serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT
-        )
+        with _sync_lock:
+            # Re-check: another thread may have created it while we waited
+            if _sync_client is None:
+                _sync_client = MongoClient(
+                    settings.MONGODB_URL,
+                    maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+                    minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
+                    serverSelectionTimeoutMS=settings.MONGODB_SERVER_SELECTION_TIMEOUT
+                )
     return _sync_client
 
 
 def get_sync_db():
-    """Get synchronous MongoDB database"""
+    """Get synchronous MongoDB database (shared across the whole process)"""
     global _sync_db
     if _sync_db is None:
-        client = get_sync_client()
-        _sync_db = client[settings.MONGODB_DB_NAME]
+        _sync_db = get_sync_client()[settings.MONGODB_DB_NAME]
     return _sync_db
 
 
@@ -92,7 +97,8 @@ def init_db():
         "topics",
         "blogs",
         "generation_history",
-        "logs"
+        "logs",
+        "cache"
     ]
 
     for collection in collections:
@@ -117,9 +123,13 @@ def _create_indexes(db):
 
     # Topics indexes
     db.topics.create_index([("category_id", ASCENDING)])
-    db.topics.create_index([("status", ASCENDING)])
+    # Also serves status-only queries through its prefix
+    db.topics.create_index([("status", ASCENDING), ("scheduled_date", ASCENDING)])
     db.topics.create_index([("scheduled_date", ASCENDING)])
     db.topics.create_index([("scheduled_date", ASCENDING), ("status", ASCENDING)])
+    db.topics.create_index([("created_at", DESCENDING)])
+    # Not unique: existing databases may already hold duplicate hashes
+    db.topics.create_index([("hash", ASCENDING)])
 
     # Blogs indexes
     db.blogs.create_index([("topic_id", ASCENDING)], unique=True)
@@ -136,6 +146,9 @@ def _create_indexes(db):
     db.logs.create_index([("status", ASCENDING)])
     db.logs.create_index([("created_at", DESCENDING)])
 
+    # Cache indexes (TTL: documents expire at their expires_at timestamp)
+    db.cache.create_index([("expires_at", ASCENDING)], expireAfterSeconds=0)
+
     logger.info("✓ Indexes created")
 
 
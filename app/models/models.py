@@ -2,7 +2,7 @@
 MongoDB document models and helper classes
 Replaces SQLAlchemy models with MongoDB-compatible structures
 """
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from bson import ObjectId
 from enum import Enum
@@ -64,10 +64,11 @@ class MongoDocument:
             del doc["_id"]
 
         # Add timestamps if not present
+        now = datetime.now(timezone.utc)
         if "created_at" not in doc:
-            doc["created_at"] = datetime.utcnow()
+            doc["created_at"] = now
         if "updated_at" not in doc:
-            doc["updated_at"] = datetime.utcnow()
+            doc["updated_at"] = now
 
         return doc
 
@@ -82,14 +83,15 @@ class Category(MongoDocument):
         is_active: bool = True
     ) -> Dict[str, Any]:
         """Create a new category document"""
+        now = datetime.now(timezone.utc)
         return {
             "name": name,
             "description": description,
             "is_active": is_active,
             "last_used_date": None,
             "usage_count": 0,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
 
     @staticmethod
@@ -113,6 +115,7 @@ class Topic(MongoDocument):
         status: TopicStatus = TopicStatus.PENDING
     ) -> Dict[str, Any]:
         """Create a new topic document"""
+        now = datetime.now(timezone.utc)
         return {
             "category_id": category_id,
             "title": title,
@@ -120,8 +123,8 @@ class Topic(MongoDocument):
             "keywords": keywords or "",
             "status": status.value if isinstance(status, TopicStatus) else status,
             "scheduled_date": scheduled_date,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
 
     @staticmethod
@@ -160,6 +163,7 @@ class Blog(MongoDocument):
             }
           }
         """
+        now = datetime.now(timezone.utc)
         return {
             "topic_id": topic_id,
             "title": title,
@@ -179,8 +183,8 @@ class Blog(MongoDocument):
 
             "cover_image_url": cover_image_url,
             "cover_image_local_path": cover_image_local_path,
-            "created_at": datetime.utcnow(),
-            "updated_at": datetime.utcnow()
+            "created_at": now,
+            "updated_at": now
         }
 
     @staticmethod
@@ -207,7 +211,7 @@ class GenerationHistory(MongoDocument):
             "topic_title": topic_title,
             "topic_keywords": topic_keywords,
             "topic_hash": topic_hash,
-            "generated_at": datetime.utcnow()
+            "generated_at": datetime.now(timezone.utc)
         }
 
     @staticmethod
@@ -232,7 +236,7 @@ class Log(MongoDocument):
             "job_type": job_type.value if isinstance(job_type, JobType) else job_type,
             "status": status.value if isinstance(status, JobStatus) else status,
             "details": details or {},
-            "created_at": datetime.utcnow()
+            "created_at": datetime.now(timezone.utc)
         }
 
     @staticmethod
@@ -2,16 +2,27 @@
 Gemini API integration service
 Handles topic generation and blog content creation
 """
+import io
 import json
+import os
 import time
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import google.generativeai as genai
 from config import settings
 from config.logging_config import get_logger
 from app.validators.blog_validators import validate_blog_data, analyze_content_structure
+from app.utils.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
+# orjson parses large LLM JSON responses faster; optional, stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so error handling is unchanged.
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class GeminiService:
     """Service for interacting with Google Gemini API"""
@@ -24,6 +35,10 @@ class GeminiService:
         self.timeout = settings.API_TIMEOUT
         self.max_retries = settings.API_MAX_RETRIES
 
+        # Every generation request (text, images, retries) goes through this limiter.
+        # Embeddings have a separate quota and are not paced here (see embed_texts).
+        self.rate_limiter = RateLimiter(settings.GEMINI_RPM, "gemini")
+
     def _call_with_retry(self, func, *args, **kwargs):
         """
         Call a function with progressive retry delays: 1min, 5min, 10min
@@ -43,6 +58,7 @@ class GeminiService:
 
         for attempt in range(1, self.max_retries + 1):
             try:
+                self.rate_limiter.acquire()
                 return func(*args, **kwargs)
             except Exception as e:
                 error_msg = str(e).lower()
@@ -147,7 +163,7 @@ class GeminiService:
             # Extract JSON from response (might have markdown code blocks)
             json_text = self._extract_json(response_text)
             logger.debug(f"Extracted JSON text: {json_text[:500]}...")
-            topics = json.loads(json_text)
+            topics = _json_loads(json_text)
 
             if not isinstance(topics, list):
                 logger.error(f"Response is not a list. Type: {type(topics)}")
@@ -181,6 +197,36 @@ class GeminiService:
             logger.error(f"Response text: {response_text}")
             raise ValueError(f"Invalid JSON response from Gemini: {e}")
 
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts with a single batch call to the Gemini embedding API
+
+        Args:
+            texts: Texts to embed (e.g. topic titles)
+
+        Returns:
+            One embedding vector per input text, in the same order
+
+        Raises:
+            Exception: If the embedding call fails. It is made once, without the
+                progressive retry delays, because callers treat embeddings as optional.
+
+        Not paced by the generation limiter: embeddings have their own quota, so
+        callers pace them separately.
+        """
+        if not texts:
+            return []
+
+        logger.info(f"Embedding {len(texts)} text(s) with {settings.GEMINI_EMBEDDING_MODEL}")
+
+        result = genai.embed_content(
+            model=settings.GEMINI_EMBEDDING_MODEL,
+            content=texts,
+            task_type="SEMANTIC_SIMILARITY",
+            output_dimensionality=settings.GEMINI_EMBEDDING_DIMENSIONS
+        )
+        return result["embedding"]
+
     def generate_blog_content(
         self,
         topic_title: str,
@@ -278,7 +324,7 @@ class GeminiService:
                             raise ValueError(f"Truncated JSON response from Gemini after {max_attempts} attempts - the content is too long for max_output_tokens={settings.GEMINI_MAX_TOKENS_BLOG}")
 
                     json_text = self._extract_json(response_text)
-                    blog_data = json.loads(json_text)
+                    blog_data = _json_loads(json_text)
 
                     # Validate all required fields are present and non-empty
                     validation_errors = self._validate_blog_data(blog_data)
@@ -309,8 +355,10 @@ class GeminiService:
                     blog_data['word_count'] = word_count
 
                     logger.info(f"Successfully generated blog content: {word_count} words, {len(content)} characters")
-                    logger.info(f"✓ SEO Title: {blog_data.get('seo_title', 'N/A')} ({len(blog_data.get('seo_title', ''))} chars)")
-                    logger.info(f"✓ Meta Description: {blog_data.get('meta_description', 'N/A')[:60]}... ({len(blog_data.get('meta_description', ''))} chars)")
+                    seo_title = blog_data.get('seo_title') or ''
+                    meta_description = blog_data.get('meta_description') or ''
+                    logger.info(f"✓ SEO Title: {seo_title or 'N/A'} ({len(seo_title)} chars)")
+                    logger.info(f"✓ Meta Description: {meta_description[:60] or 'N/A'}... ({len(meta_description)} chars)")
                     logger.info(f"✓ Tags: {len(blog_data.get('tags', []))} tags")
                     return blog_data
 
@@ -580,7 +628,10 @@ CRITICAL OUTPUT REQUIREMENTS:
         save_path: Optional[str] = None
     ) -> Optional[str]:
         """
-        Generate blog cover image using Gemini image generation (v1/Tier One)
+        Generate blog cover image and save it to a local file
+
+        Prefer generate_blog_cover_image_bytes when the image is only
+        uploaded; this file-based variant is kept as a fallback.
 
         Args:
             blog_title: The blog post title
@@ -591,6 +642,63 @@ CRITICAL OUTPUT REQUIREMENTS:
         Returns:
             Path to saved image file, or None if generation failed
         """
+        image = self._generate_cover_image(blog_title, blog_description, keywords)
+        if image is None:
+            return None
+
+        if not save_path:
+            # Create temp path
+            timestamp = int(time.time())
+            safe_title = "".join([c for c in blog_title if c.isalnum() or c in (' ', '-')]).strip().replace(" ", "_")[:30]
+            filename = f"blog_image_{timestamp}_{safe_title}.png"
+            save_path = os.path.join(settings.IMAGE_TEMP_DIR, filename)
+
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+
+        image.save(save_path, 'PNG', optimize=True, quality=95)
+        logger.info(f"Success! Image saved to: {save_path}")
+        return save_path
+
+    def generate_blog_cover_image_bytes(
+        self,
+        blog_title: str,
+        blog_description: Optional[str] = None,
+        keywords: Optional[List[str]] = None
+    ) -> Optional[Tuple[bytes, str]]:
+        """
+        Generate blog cover image in memory (no temp file)
+
+        Args:
+            blog_title: The blog post title
+            blog_description: Optional blog description for context
+            keywords: Optional list of keywords
+
+        Returns:
+            Tuple of (PNG bytes, content type), or None if generation failed
+        """
+        image = self._generate_cover_image(blog_title, blog_description, keywords)
+        if image is None:
+            return None
+
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', optimize=True, quality=95)
+        data = buffer.getvalue()
+        logger.info(f"Success! Image generated in memory ({len(data)} bytes)")
+        return data, "image/png"
+
+    def _generate_cover_image(
+        self,
+        blog_title: str,
+        blog_description: Optional[str] = None,
+        keywords: Optional[List[str]] = None
+    ):
+        """
+        Generate blog cover image using Gemini image generation (v1/Tier One)
+
+        Returns:
+            PIL Image resized to 1200x630, or None if generation failed
+        """
         if not settings.ENABLE_BLOG_IMAGES:
             logger.info("Blog image generation is disabled")
             return None
@@ -609,8 +717,6 @@ CRITICAL OUTPUT REQUIREMENTS:
             from google import genai
             from google.genai import types
             from PIL import Image
-            import io
-            import os
 
             client = genai.Client(api_key=api_key)
 
@@ -618,6 +724,7 @@ CRITICAL OUTPUT REQUIREMENTS:
 
             logger.info(f"Calling Gemini Image API with prompt length: {len(prompt_text)}")
 
+            self.rate_limiter.acquire()
             response = client.models.generate_content(
                 model="gemini-2.5-flash-image", # User specified this model
                 contents=prompt_text,
@@ -645,20 +752,7 @@ CRITICAL OUTPUT REQUIREMENTS:
                     image_resized = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
 
                     logger.info(f"Resized to OG image dimensions: {target_width}x{target_height}")
-
-                    if not save_path:
-                        # Create temp path
-                        timestamp = int(time.time())
-                        safe_title = "".join([c for c in blog_title if c.isalnum() or c in (' ', '-')]).strip().replace(" ", "_")[:30]
-                        filename = f"blog_image_{timestamp}_{safe_title}.png"
-                        save_path = os.path.join(settings.IMAGE_TEMP_DIR, filename)
-
-                    # Ensure directory exists
-                    os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-                    image_resized.save(save_path, 'PNG', optimize=True, quality=95)
-                    logger.info(f"Success! Image saved to: {save_path}")
-                    return save_path
+                    return image_resized
 
             logger.warning("No image data found in the response")
             return None
@@ -6,6 +6,7 @@ import os
 import requests
 from typing import Optional, Dict
 from config.logging_config import get_logger
+from app.services.http_session import http_session
 
 logger = get_logger(__name__)
 
@@ -13,16 +14,23 @@ logger = get_logger(__name__)
 class HashnodeCDNService:
     """Service for uploading images to Hashnode's CDN"""
 
-    def __init__(self, api_token: str, jwt_token: Optional[str] = None):
+    def __init__(
+        self,
+        api_token: str,
+        jwt_token: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """
         Initialize Hashnode CDN service
 
         Args:
             api_token: Hashnode Personal Access Token (PAT)
             jwt_token: Optional JWT token from browser cookies (required for CDN upload)
+            session: Optional requests.Session (defaults to the shared pooled session)
         """
         self.api_token = api_token
         self.jwt_token = jwt_token
+        self.session = session or http_session
         self.upload_image_endpoint = "https://hashnode.com/api/upload-image"
         self.timeout = 60  # seconds
 
@@ -48,7 +56,7 @@ class HashnodeCDNService:
                     "Cookie": f"jwt={self.jwt_token}",
                     "Content-Type": "application/json"
                 }
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
             else:
                 # Try with PAT (likely to fail with 401, but worth trying)
                 logger.info(f"Requesting S3 credentials from Hashnode for .{image_extension} image (using PAT)")
@@ -57,13 +65,13 @@ class HashnodeCDNService:
                     "Authorization": f"Bearer {self.api_token}",
                     "Content-Type": "application/json"
                 }
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
 
                 # If Bearer token fails with 401, try without Bearer prefix
                 if response.status_code == 401:
                     logger.info("Bearer token failed, trying without Bearer prefix...")
                     headers["Authorization"] = self.api_token
-                    response = requests.get(url, headers=headers, timeout=self.timeout)
+                    response = self.session.get(url, headers=headers, timeout=self.timeout)
 
             response.raise_for_status()
 
@@ -90,20 +98,21 @@ class HashnodeCDNService:
             logger.error(f"Failed to get S3 credentials from Hashnode: {e}")
             return None
 
-    def _upload_to_s3(self, s3_url: str, s3_fields: Dict, image_path: str) -> bool:
+    def _upload_to_s3(self, s3_url: str, s3_fields: Dict, filename: str, file_obj) -> bool:
         """
         Upload image to S3 using provided credentials
 
         Args:
             s3_url: S3 bucket endpoint URL
             s3_fields: S3 upload credentials (key, bucket, etc.)
-            image_path: Local path to image file
+            filename: File name sent with the multipart upload
+            file_obj: Open file or raw bytes of the image
 
         Returns:
             True if upload successful, False otherwise
         """
         try:
-            logger.info(f"Uploading image to S3: {image_path}")
+            logger.info(f"Uploading image to S3: {filename}")
 
             # Prepare multipart form data
             # Include all credential fields from Hashnode
@@ -112,12 +121,11 @@ class HashnodeCDNService:
                 form_data[key] = (None, value)
 
             # Add the file last (order matters for S3)
-            with open(image_path, 'rb') as f:
-                form_data['file'] = (os.path.basename(image_path), f, 'application/octet-stream')
+            form_data['file'] = (filename, file_obj, 'application/octet-stream')
 
-                # Upload to S3
-                # NOTE: Don't set Content-Type header explicitly - let requests handle it
-                response = requests.post(s3_url, files=form_data, timeout=self.timeout)
+            # Upload to S3
+            # NOTE: Don't set Content-Type header explicitly - let requests handle it
+            response = self.session.post(s3_url, files=form_data, timeout=self.timeout)
 
             # S3 returns 204 No Content on success
             if response.status_code == 204:
@@ -145,9 +153,36 @@ class HashnodeCDNService:
             logger.error(f"Image file not found: {image_path}")
             return None
 
+        with open(image_path, 'rb') as f:
+            return self._upload(os.path.basename(image_path), f)
+
+    def upload_image_bytes(self, data: bytes, filename: str) -> Optional[str]:
+        """
+        Upload in-memory image data to Hashnode CDN and return CDN URL
+
+        Args:
+            data: Raw image bytes
+            filename: File name (its extension sets the image type)
+
+        Returns:
+            Hashnode CDN URL of uploaded image, or None if upload failed
+        """
+        return self._upload(filename, data)
+
+    def _upload(self, filename: str, file_obj) -> Optional[str]:
+        """
+        Get S3 credentials from Hashnode, upload the image and build the CDN URL
+
+        Args:
+            filename: File name (its extension sets the image type)
+            file_obj: Open file or raw bytes of the image
+
+        Returns:
+            Hashnode CDN URL of uploaded image, or None if upload failed
+        """
         try:
             # Get file extension
-            _, ext = os.path.splitext(image_path)
+            _, ext = os.path.splitext(filename)
             ext = ext.lstrip('.').lower()
 
             if not ext:
@@ -164,7 +199,7 @@ class HashnodeCDNService:
             s3_fields = credentials["fields"]
 
             # Step 2: Upload to S3
-            upload_success = self._upload_to_s3(s3_url, s3_fields, image_path)
+            upload_success = self._upload_to_s3(s3_url, s3_fields, filename, file_obj)
             if not upload_success:
                 logger.error("Failed to upload image to S3")
                 return None
@@ -8,9 +8,17 @@ import requests
 from typing import Dict, Optional
 from config import settings
 from config.logging_config import get_logger
+from app.services.http_session import http_session
 
 logger = get_logger(__name__)
 
+# Tag slug cleanup patterns, compiled once
+_INVALID_SLUG_CHARS = re.compile(r'[^a-z0-9-]')
+_REPEATED_HYPHENS = re.compile(r'-+')
+
+# GraphQL string escapes (backslash, quote, newline, carriage return, tab), applied in a single pass
+_GRAPHQL_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
 
 class HashnodeService:
     """Service for interacting with Hashnode GraphQL API"""
@@ -31,6 +39,9 @@ class HashnodeService:
         self.timeout = settings.API_TIMEOUT
         self.max_retries = settings.API_MAX_RETRIES
 
+        # Shared keep-alive session so repeated calls reuse the TLS connection
+        self.session = http_session
+
         if not self.api_token or not self.publication_id:
             raise ValueError(f"Hashnode API token and publication ID are required for {publication_name}")
 
@@ -144,7 +155,7 @@ class HashnodeService:
                 "Content-Type": "application/json"
             }
 
-            response = requests.post(
+            response = self.session.post(
                 self.api_url,
                 json={"query": mutation},
                 headers=headers,
@@ -305,9 +316,9 @@ class HashnodeService:
             # Replace spaces with hyphens
             slug = slug.replace(" ", "-")
             # Replace any invalid characters (not a-z, 0-9, or -) with hyphens
-            slug = re.sub(r'[^a-z0-9-]', '-', slug)
+            slug = _INVALID_SLUG_CHARS.sub('-', slug)
             # Remove consecutive hyphens
-            slug = re.sub(r'-+', '-', slug)
+            slug = _REPEATED_HYPHENS.sub('-', slug)
             # Remove leading/trailing hyphens
             slug = slug.strip('-')
             # Limit to 250 characters
@@ -369,18 +380,7 @@ class HashnodeService:
         if not text:
             return ""
 
-        # Escape backslashes first
-        text = text.replace("\\", "\\\\")
-        # Escape double quotes
-        text = text.replace('"', '\\"')
-        # Escape newlines
-        text = text.replace("\n", "\\n")
-        # Escape carriage returns
-        text = text.replace("\r", "\\r")
-        # Escape tabs
-        text = text.replace("\t", "\\t")
-
-        return text
+        return text.translate(_GRAPHQL_ESCAPES)
 
     def get_publication_info(self) -> Dict:
         """
@@ -413,7 +413,7 @@ class HashnodeService:
             "Content-Type": "application/json"
         }
 
-        response = requests.post(
+        response = self.session.post(
             self.api_url,
             json={"query": query},
             headers=headers,
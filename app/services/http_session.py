@@ -0,0 +1,32 @@
+"""
+Shared HTTP session
+One pooled, keep-alive requests.Session for the services that call HTTP APIs directly
+"""
+from http.cookiejar import DefaultCookiePolicy
+import requests
+from requests.adapters import HTTPAdapter
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a pooled requests.Session
+
+    Connections (and their TLS handshakes) are reused across calls to the same host.
+    Connection errors are retried by the adapter. The cookie jar is disabled
+    because one session serves several publications with different tokens, so
+    cookies must never carry over between them. Auth is always sent as
+    explicit headers.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=3)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+# Singleton instance
+http_session = create_http_session()
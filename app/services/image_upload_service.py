@@ -2,8 +2,11 @@
 Image Upload Service
 Handles uploading blog cover images to AWS S3, Hashnode CDN, or both
 """
+import io
 import os
-from typing import Optional, Literal
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Literal
 import boto3
 from botocore.exceptions import ClientError
 from config import settings
@@ -51,23 +54,45 @@ class ImageUploadService:
             logger.warning("AWS S3 client not initialized - skipping upload")
             return None
 
-        if not os.path.exists(image_path):
-            logger.error(f"Image file not found: {image_path}")
+        data = self._read_image(image_path)
+        if data is None:
+            return None
+
+        # Object name comes from the file name
+        return self.upload_bytes_to_s3(data, os.path.basename(image_path))
+
+    def upload_bytes_to_s3(
+        self,
+        data: bytes,
+        filename: str,
+        content_type: str = "image/png"
+    ) -> Optional[str]:
+        """
+        Upload in-memory image data to AWS S3 and return public URL
+
+        Args:
+            data: Raw image bytes
+            filename: Object file name (stored under blog-covers/)
+            content_type: MIME type of the image
+
+        Returns:
+            Public URL of uploaded image, or None if upload failed
+        """
+        if not self.s3_client:
+            logger.warning("AWS S3 client not initialized - skipping upload")
             return None
 
         try:
-            logger.info(f"Uploading image to AWS S3: {image_path}")
+            logger.info(f"Uploading image to AWS S3: {filename} ({len(data)} bytes)")
 
-            # Generate object name from filename
-            filename = os.path.basename(image_path)
             object_name = f"blog-covers/{filename}"
 
-            # Upload file to S3 (public access controlled by bucket policy)
-            self.s3_client.upload_file(
-                image_path,
-                self.bucket_name,
-                object_name,
-                ExtraArgs={'ContentType': 'image/png'}
+            # Upload straight from memory (public access controlled by bucket policy)
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                Body=io.BytesIO(data),
+                ContentType=content_type
             )
 
             # Construct public URL
@@ -82,6 +107,27 @@ class ImageUploadService:
             logger.error(f"Unexpected error uploading to S3: {e}", exc_info=True)
             return None
 
+    def _read_image(self, image_path: str) -> Optional[bytes]:
+        """
+        Read a local image file for upload
+
+        Args:
+            image_path: Local path to image file
+
+        Returns:
+            File contents, or None if the file is missing or unreadable
+        """
+        if not os.path.exists(image_path):
+            logger.error(f"Image file not found: {image_path}")
+            return None
+
+        try:
+            with open(image_path, 'rb') as f:
+                return f.read()
+        except OSError as e:
+            logger.error(f"Failed to read image {image_path}: {e}")
+            return None
+
     def cleanup_local_image(self, image_path: Optional[str]) -> bool:
         """
         Delete local temporary image file
@@ -117,6 +163,36 @@ class ImageUploadService:
             api_token: Hashnode API token (Personal Access Token)
             jwt_token: Optional JWT token from browser cookies (required for CDN upload)
 
+        Returns:
+            Hashnode CDN URL of uploaded image, or None if upload failed
+        """
+        data = self._read_image(image_path)
+        if data is None:
+            return None
+
+        return self.upload_bytes_to_hashnode_cdn(
+            data,
+            os.path.basename(image_path),
+            api_token,
+            jwt_token=jwt_token
+        )
+
+    def upload_bytes_to_hashnode_cdn(
+        self,
+        data: bytes,
+        filename: str,
+        api_token: str,
+        jwt_token: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Upload in-memory image data to Hashnode CDN and return CDN URL
+
+        Args:
+            data: Raw image bytes
+            filename: File name (its extension sets the image type)
+            api_token: Hashnode API token (Personal Access Token)
+            jwt_token: Optional JWT token from browser cookies (required for CDN upload)
+
         Returns:
             Hashnode CDN URL of uploaded image, or None if upload failed
         """
@@ -124,12 +200,106 @@ class ImageUploadService:
 
         try:
             cdn_service = HashnodeCDNService(api_token=api_token, jwt_token=jwt_token)
-            cdn_url = cdn_service.upload_image(image_path)
-            return cdn_url
+            return cdn_service.upload_image_bytes(data, filename)
         except Exception as e:
             logger.error(f"Failed to upload to Hashnode CDN: {e}")
             return None
 
+    def _run_uploads(
+        self,
+        upload_to: Literal["s3", "hashnode", "both"],
+        hashnode_api_token: Optional[str],
+        s3_upload: Callable[[], Optional[str]],
+        hashnode_upload: Callable[[], Optional[str]]
+    ) -> dict:
+        """
+        Run the requested uploads; S3 and Hashnode CDN run in parallel for "both"
+
+        Args:
+            upload_to: Where to upload the image ("s3", "hashnode", or "both")
+            hashnode_api_token: Required if upload_to is "hashnode" or "both"
+            s3_upload: Performs the S3 upload, returns URL or None
+            hashnode_upload: Performs the Hashnode CDN upload, returns URL or None
+
+        Returns:
+            Dictionary with s3_url, hashnode_url and success (see upload_and_cleanup)
+        """
+        result = {
+            "s3_url": None,
+            "hashnode_url": None,
+            "success": False
+        }
+
+        uploads: Dict[str, Callable[[], Optional[str]]] = {}
+        if upload_to in ["s3", "both"]:
+            uploads["s3_url"] = s3_upload
+        if upload_to in ["hashnode", "both"]:
+            if not hashnode_api_token:
+                logger.error("Hashnode API token required for uploading to Hashnode CDN")
+            else:
+                uploads["hashnode_url"] = hashnode_upload
+
+        # Both uploads are independent network I/O, so overlap them
+        if len(uploads) > 1:
+            with ThreadPoolExecutor(max_workers=len(uploads)) as pool:
+                futures = {key: pool.submit(upload) for key, upload in uploads.items()}
+                urls = {key: future.result() for key, future in futures.items()}
+        else:
+            urls = {key: upload() for key, upload in uploads.items()}
+
+        for key, url in urls.items():
+            result[key] = url
+            if url:
+                result["success"] = True
+
+        return result
+
+    def upload_bytes(
+        self,
+        data: bytes,
+        title: Optional[str] = None,
+        content_type: str = "image/png",
+        upload_to: Literal["s3", "hashnode", "both"] = "s3",
+        hashnode_api_token: Optional[str] = None,
+        hashnode_jwt_token: Optional[str] = None
+    ) -> dict:
+        """
+        Upload in-memory image data to AWS S3, Hashnode CDN, or both
+
+        Same result shape as upload_and_cleanup, without a local temp file.
+
+        Args:
+            data: Raw image bytes
+            title: Optional image title (used for generating object name)
+            content_type: MIME type of the image
+            upload_to: Where to upload the image ("s3", "hashnode", or "both")
+            hashnode_api_token: Required if upload_to is "hashnode" or "both"
+            hashnode_jwt_token: Optional JWT token for Hashnode CDN upload
+
+        Returns:
+            Dictionary with:
+                - s3_url: S3 URL (if uploaded to S3)
+                - hashnode_url: Hashnode CDN URL (if uploaded to Hashnode)
+                - success: True if at least one upload succeeded
+        """
+        # Generate file name from title
+        timestamp = int(time.time())
+        safe_title = "".join([c for c in (title or "") if c.isalnum() or c in (' ', '-')]).strip().replace(" ", "_")[:30]
+        extension = content_type.split("/")[-1]
+        filename = f"blog_image_{timestamp}_{safe_title}.{extension}"
+
+        return self._run_uploads(
+            upload_to,
+            hashnode_api_token,
+            s3_upload=lambda: self.upload_bytes_to_s3(data, filename, content_type=content_type),
+            hashnode_upload=lambda: self.upload_bytes_to_hashnode_cdn(
+                data,
+                filename,
+                hashnode_api_token,
+                jwt_token=hashnode_jwt_token
+            )
+        )
+
     def upload_and_cleanup(
         self,
         image_path: str,
@@ -156,32 +326,16 @@ class ImageUploadService:
                 - hashnode_url: Hashnode CDN URL (if uploaded to Hashnode)
                 - success: True if at least one upload succeeded
         """
-        result = {
-            "s3_url": None,
-            "hashnode_url": None,
-            "success": False
-        }
-
-        # Upload to S3 if requested
-        if upload_to in ["s3", "both"]:
-            s3_url = self.upload_to_s3(image_path, title=title)
-            result["s3_url"] = s3_url
-            if s3_url:
-                result["success"] = True
-
-        # Upload to Hashnode CDN if requested
-        if upload_to in ["hashnode", "both"]:
-            if not hashnode_api_token:
-                logger.error("Hashnode API token required for uploading to Hashnode CDN")
-            else:
-                hashnode_url = self.upload_to_hashnode_cdn(
-                    image_path,
-                    hashnode_api_token,
-                    jwt_token=hashnode_jwt_token
-                )
-                result["hashnode_url"] = hashnode_url
-                if hashnode_url:
-                    result["success"] = True
+        result = self._run_uploads(
+            upload_to,
+            hashnode_api_token,
+            s3_upload=lambda: self.upload_to_s3(image_path, title=title),
+            hashnode_upload=lambda: self.upload_to_hashnode_cdn(
+                image_path,
+                hashnode_api_token,
+                jwt_token=hashnode_jwt_token
+            )
+        )
 
         # Cleanup temp file after upload (success or failure)
         if result["success"]:
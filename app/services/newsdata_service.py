@@ -2,22 +2,52 @@
 NewsData.io API Service
 Fetches latest tech news to inform blog topic generation
 """
-from newsdataapi import NewsDataApiClient
+import random
+import time
+from collections import Counter
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
+import requests
 from config import settings
 from config.logging_config import get_logger
+from app.services.http_session import http_session
 
 logger = get_logger(__name__)
 
+NEWSDATA_LATEST_URL = "https://newsdata.io/api/1/latest"
+
+# Article fields we never read (full content, media, author lists)
+UNUSED_ARTICLE_FIELDS = ["content", "image_url", "video_url", "creator", "source_icon"]
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds (None if absent or not numeric)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _error_code(response: requests.Response) -> Optional[str]:
+    """Get the NewsData error code (e.g. "TooManyRequests") from an error response body"""
+    try:
+        results = response.json().get('results')
+    except ValueError:
+        return None
+    return results.get('code') if isinstance(results, dict) else None
+
 
 class NewsDataService:
     """Service for fetching and processing news from NewsData.io API"""
 
     def __init__(self):
-        """Initialize NewsData.io API client"""
+        """Initialize NewsData.io API access"""
         self.api_key = settings.NEWSDATA_API_KEY
-        self.client = NewsDataApiClient(apikey=self.api_key)
+        # The /latest endpoint is called directly on the shared session: the
+        # newsdataapi client hides status codes and Retry-After, and sleeps up to
+        # 15 minutes internally on rate limits before raising
+        self.session = http_session
+        self.max_retries = settings.NEWSDATA_MAX_RETRIES
         self.max_articles = settings.NEWSDATA_MAX_ARTICLES
         self.lookback_days = settings.NEWSDATA_LOOKBACK_DAYS
         logger.info("NewsDataService initialized")
@@ -26,6 +56,11 @@ class NewsDataService:
         """
         Fetch latest technology news from NewsData.io
 
+        Server errors, burst 429s and connection errors are retried with exponential
+        backoff and jitter, waiting at least as long as Retry-After asks. An
+        exhausted credit quota and other client errors (bad API key, invalid
+        parameters) are not retried.
+
         Args:
             max_articles: Maximum number of articles to fetch (default from settings)
 
@@ -35,25 +70,80 @@ class NewsDataService:
         max_results = max_articles or self.max_articles
         logger.info(f"Fetching latest tech news (max: {max_results} articles)")
 
-        try:
-            # Fetch latest tech news in English
-            response = self.client.latest_api(
-                category='technology',
-                language='en',
-                max_result=max_results
-            )
-
-            if response.get('status') == 'success':
-                articles = response.get('results', [])
-                logger.info(f"Successfully fetched {len(articles)} tech articles from newsdata.io")
-                return articles
-            else:
-                logger.error(f"NewsData API returned non-success status: {response}")
+        # Latest tech news in English (one page). Fields nothing here reads are
+        # excluded server-side so less JSON is transferred and parsed.
+        params = {
+            "category": "technology",
+            "language": "en",
+            "excludefield": ",".join(UNUSED_ARTICLE_FIELDS)
+        }
+        # Key in a header rather than the query string, so it never shows up in error messages
+        headers = {"X-ACCESS-KEY": self.api_key}
+
+        for attempt in range(1, self.max_retries + 1):
+            retry_after = None
+            try:
+                response = self.session.get(
+                    NEWSDATA_LATEST_URL,
+                    params=params,
+                    headers=headers,
+                    timeout=settings.API_TIMEOUT
+                )
+
+                if response.status_code == 200:
+                    data = response.json()
+                    if data.get('status') == 'success':
+                        articles = data.get('results', [])[:max_results]
+                        logger.info(f"Successfully fetched {len(articles)} tech articles from newsdata.io")
+                        return articles
+                    logger.error(f"NewsData API returned non-success status: {data}")
+                    return []
+
+                if response.status_code != 429 and response.status_code < 500:
+                    logger.error(
+                        f"NewsData API rejected the request ({response.status_code}), "
+                        f"not retrying: {response.text[:200]}"
+                    )
+                    return []
+
+                error = f"HTTP {response.status_code}"
+                if response.status_code == 429:
+                    # TooManyRequests is a short burst limit; RateLimitExceeded means the
+                    # API credit quota is used up, which no retry in this run will fix
+                    code = _error_code(response)
+                    if code == "RateLimitExceeded":
+                        logger.error("NewsData API credit quota exhausted, not retrying")
+                        return []
+                    error = f"HTTP 429 {code or ''}".rstrip()
+
+                retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+
+            except (requests.RequestException, ValueError) as e:
+                error = str(e)
+
+            if attempt == self.max_retries:
+                logger.error(f"Failed to fetch news from newsdata.io: {error}")
                 return []
 
-        except Exception as e:
-            logger.error(f"Failed to fetch news from newsdata.io: {str(e)}", exc_info=True)
-            return []
+            # Exponential backoff with jitter: ~5s, ~10s, ~20s ... capped
+            delay = min(
+                settings.NEWSDATA_RETRY_BACKOFF_MAX,
+                settings.NEWSDATA_RETRY_BACKOFF * 2 ** (attempt - 1) + random.uniform(0, 2)
+            )
+            if retry_after is not None:
+                # A wait longer than the cap is not worth blocking topic selection for
+                if retry_after > settings.NEWSDATA_RETRY_BACKOFF_MAX:
+                    logger.error(f"NewsData asked to retry after {retry_after:.0f}s, giving up: {error}")
+                    return []
+                delay = max(delay, retry_after)
+
+            logger.warning(
+                f"News fetch failed (attempt {attempt}/{self.max_retries}): {error}. "
+                f"Retrying in {delay:.1f}s..."
+            )
+            time.sleep(delay)
+
+        return []
 
     def extract_trending_topics(self, articles: List[Dict]) -> List[Dict]:
         """
@@ -148,16 +238,13 @@ class NewsDataService:
         if not articles:
             return []
 
-        # Collect all keywords
-        all_keywords = []
-        for article in articles:
-            keywords = article.get('keywords', [])
-            if keywords:
-                all_keywords.extend(keywords)
-
-        # Count frequency and return unique keywords
-        from collections import Counter
-        keyword_counts = Counter(all_keywords)
+        # Count keyword frequency in one pass (no intermediate list);
+        # most_common(k) uses a heap instead of sorting every keyword
+        keyword_counts = Counter(
+            keyword
+            for article in articles
+            for keyword in (article.get('keywords') or [])
+        )
         trending = [kw for kw, count in keyword_counts.most_common(20)]
 
         logger.info(f"Extracted {len(trending)} trending keywords from {len(articles)} articles")
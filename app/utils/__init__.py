@@ -1,17 +1,27 @@
 from .uniqueness import (
     calculate_similarity,
+    calculate_preprocessed_similarity,
     generate_topic_hash,
     is_similar_topic,
     validate_topic_uniqueness,
     get_unique_topics,
-    extract_keywords
+    extract_keywords,
+    preprocess_title,
+    TitleIndex,
+    normalize_embeddings,
+    max_cosine_similarity
 )
 
 __all__ = [
     "calculate_similarity",
+    "calculate_preprocessed_similarity",
     "generate_topic_hash",
     "is_similar_topic",
     "validate_topic_uniqueness",
     "get_unique_topics",
-    "extract_keywords"
+    "extract_keywords",
+    "preprocess_title",
+    "TitleIndex",
+    "normalize_embeddings",
+    "max_cosine_similarity"
 ]
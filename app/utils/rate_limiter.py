@@ -0,0 +1,54 @@
+"""
+Request pacing for external APIs
+Spaces calls evenly so a service never exceeds its requests-per-minute cap
+"""
+import threading
+import time
+from typing import Optional
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimiter:
+    """
+    Thread-safe requests-per-minute limiter
+
+    Each acquire() reserves the next free slot (60 / rpm seconds after the
+    previous one) and sleeps only for the time left until that slot, so
+    callers never wait when they are already slower than the cap.
+    """
+
+    def __init__(self, rpm: Optional[int], name: str = "api"):
+        """
+        Args:
+            rpm: Maximum requests per minute (None or 0 disables pacing)
+            name: Service name used in log messages
+        """
+        self.rpm = rpm
+        self.name = name
+        self._next_slot: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Block until the next request may be sent
+
+        Returns:
+            Seconds slept
+        """
+        if not self.rpm:
+            return 0.0
+
+        # Reserve the slot under the lock so concurrent callers queue up
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            if self._next_slot is not None:
+                wait = max(0.0, self._next_slot - now)
+            self._next_slot = now + wait + 60.0 / self.rpm
+
+        if wait > 0:
+            logger.info(f"⏳ Pacing {self.name} API (sleeping for {wait:.1f}s)")
+            time.sleep(wait)
+        return wait
@@ -4,8 +4,10 @@ Implements similarity detection and hash-based duplicate checking
 """
 import hashlib
 import re
-from typing import List, Set
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
 from difflib import SequenceMatcher
+import numpy as np
 
 # Common English stop words to exclude from keyword extraction
 STOP_WORDS = {
@@ -48,27 +50,52 @@ def extract_keywords(text: str) -> Set[str]:
     - Keep only words longer than 2 characters
     - Return unique words
     """
-    normalized = normalize_text(text)
-    words = normalized.split()
+    return _keywords_from_normalized(normalize_text(text))
 
+
+def _keywords_from_normalized(normalized: str) -> Set[str]:
+    """Extract keywords from text that has already been normalized"""
     # Filter out stop words and short words
     keywords = {
-        word for word in words
+        word for word in normalized.split()
         if word not in STOP_WORDS and len(word) > 2
     }
 
     return keywords
 
 
+def preprocess_title(title: str, source: str = "topic") -> Dict[str, Any]:
+    """
+    Preprocess a title once so it can be compared many times
+    without re-normalizing (see calculate_preprocessed_similarity)
+
+    Args:
+        title: The topic title
+        source: Where the title came from ("topic" or "history")
+
+    Returns:
+        Dict with keys: title, normalized, keywords (sorted list), source
+    """
+    normalized = normalize_text(title)
+    return {
+        "title": title,
+        "normalized": normalized,
+        "keywords": sorted(_keywords_from_normalized(normalized)),
+        "source": source
+    }
+
+
 def calculate_jaccard_similarity(text1: str, text2: str) -> float:
     """
     Calculate Jaccard similarity between two texts
     Similarity = |intersection| / |union|
     Returns float between 0.0 (completely different) and 1.0 (identical)
     """
-    keywords1 = extract_keywords(text1)
-    keywords2 = extract_keywords(text2)
+    return _jaccard(extract_keywords(text1), extract_keywords(text2))
+
 
+def _jaccard(keywords1: Set[str], keywords2: Set[str]) -> float:
+    """Jaccard similarity between two keyword sets"""
     if not keywords1 and not keywords2:
         return 1.0  # Both empty
     if not keywords1 or not keywords2:
@@ -118,6 +145,166 @@ def calculate_similarity(text1: str, text2: str, method: str = "combined") -> fl
         raise ValueError(f"Unknown similarity method: {method}")
 
 
+def calculate_preprocessed_similarity(
+    title1: Dict[str, Any],
+    title2: Dict[str, Any],
+    score_cutoff: float = 0.0
+) -> float:
+    """
+    Calculate combined similarity between two titles from preprocess_title
+
+    Same score as calculate_similarity(..., method="combined") but skips
+    normalization and keyword extraction, which were done up front.
+
+    Args:
+        title1: First preprocessed title
+        title2: Second preprocessed title
+        score_cutoff: If set, return 0.0 as soon as the score provably
+            cannot reach it (SequenceMatcher's cheap upper bounds are
+            checked before the full ratio)
+
+    Returns:
+        Similarity score between 0.0 and 1.0
+    """
+    jaccard = _jaccard(set(title1["keywords"]), set(title2["keywords"]))
+    matcher = SequenceMatcher(None, title1["normalized"], title2["normalized"])
+
+    if score_cutoff > 0:
+        # Sequence ratio needed to reach the cutoff given the Jaccard part
+        needed = (score_cutoff - jaccard * 0.6) / 0.4 - 1e-9
+        if needed > 0 and (matcher.real_quick_ratio() < needed or matcher.quick_ratio() < needed):
+            return 0.0
+
+    return (jaccard * 0.6) + (matcher.ratio() * 0.4)
+
+
+class TitleIndex:
+    """
+    Inverted keyword index over preprocessed titles for fast uniqueness checks
+
+    Combined similarity is 0.6 * jaccard + 0.4 * sequence, so a title can only
+    reach a threshold t if its keyword Jaccard is at least (t - 0.4) / 0.6.
+    The index counts shared keywords per title to get the exact Jaccard, and
+    only runs SequenceMatcher on titles that can still reach the threshold.
+    Unlike MinHash/LSH this pruning is lossless.
+    """
+
+    def __init__(self, titles: Optional[List[Dict[str, Any]]] = None):
+        """
+        Args:
+            titles: Titles from preprocess_title to index
+        """
+        self.titles: List[Dict[str, Any]] = []
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        self._by_normalized: Dict[str, int] = {}
+        for title in titles or []:
+            self.add(title)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    @staticmethod
+    def _index_keys(title: Dict[str, Any]) -> List[str]:
+        # Titles without keywords share the "" key: two empty sets have Jaccard 1.0
+        return title["keywords"] or [""]
+
+    def add(self, title: Dict[str, Any]):
+        """Add a preprocessed title to the index"""
+        idx = len(self.titles)
+        self.titles.append(title)
+        self._by_normalized.setdefault(title["normalized"], idx)
+        for key in self._index_keys(title):
+            self._postings[key].append(idx)
+
+    def find_exact(self, title: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        O(1) lookup of an indexed title with the same normalized text
+
+        Args:
+            title: Preprocessed candidate title
+
+        Returns:
+            The matching title dict, or None
+        """
+        idx = self._by_normalized.get(title["normalized"])
+        return self.titles[idx] if idx is not None else None
+
+    def find_similar(self, title: Dict[str, Any], threshold: float) -> Optional[Tuple[Dict[str, Any], float]]:
+        """
+        Find the first indexed title whose combined similarity reaches threshold
+
+        Args:
+            title: Preprocessed candidate title
+            threshold: Similarity threshold (0.0 - 1.0)
+
+        Returns:
+            Tuple of (matching title dict, similarity), or None if unique
+        """
+        # Small epsilon so float rounding never prunes a borderline match
+        min_jaccard = (threshold - 0.4) / 0.6 - 1e-9
+
+        if min_jaccard <= 0:
+            # Sequence similarity alone could reach the threshold: score everything
+            candidates = range(len(self.titles))
+        else:
+            keys = self._index_keys(title)
+            shared: Dict[int, int] = defaultdict(int)
+            for key in keys:
+                for idx in self._postings.get(key, ()):
+                    shared[idx] += 1
+
+            candidates = []
+            for idx in sorted(shared):
+                other_keys = self._index_keys(self.titles[idx])
+                jaccard = shared[idx] / (len(keys) + len(other_keys) - shared[idx])
+                if jaccard >= min_jaccard:
+                    candidates.append(idx)
+
+        for idx in candidates:
+            existing = self.titles[idx]
+            similarity = calculate_preprocessed_similarity(title, existing, score_cutoff=threshold)
+            if similarity >= threshold:
+                return existing, similarity
+
+        return None
+
+
+def normalize_embeddings(vectors) -> np.ndarray:
+    """
+    Convert embedding vectors to a float32 matrix with unit-length rows
+    so cosine similarity becomes a plain dot product
+
+    Args:
+        vectors: A single vector or a list of vectors
+
+    Returns:
+        2-D array of shape (n, dim)
+    """
+    matrix = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def max_cosine_similarity(matrix: np.ndarray, query: np.ndarray) -> Tuple[float, int]:
+    """
+    Find the row of a unit-normalized embedding matrix closest to a query
+
+    Args:
+        matrix: Array of shape (n, dim) from normalize_embeddings
+        query: Unit-normalized vector of shape (dim,)
+
+    Returns:
+        Tuple of (best cosine similarity, row index), or (0.0, -1) if matrix is empty
+    """
+    if matrix.shape[0] == 0:
+        return 0.0, -1
+
+    sims = matrix @ query
+    idx = int(np.argmax(sims))
+    return float(sims[idx]), idx
+
+
 def generate_topic_hash(topic_title: str) -> str:
     """
     Generate SHA-256 hash of normalized topic title
@@ -14,6 +14,17 @@ from dataclasses import dataclass
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 
+# Markdown patterns used by analyze_content_structure, compiled once
+_H2_PATTERN = re.compile(r'^##\s+(.+)$')
+_H3_PATTERN = re.compile(r'^###\s+(.+)$')
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_INLINE_CODE_RE = re.compile(r'`[^`]+`')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+_HEADING_MARKER_RE = re.compile(r'^#+\s+', flags=re.MULTILINE)
+_BOLD_ITALIC_RE = re.compile(r'\*+([^*]+)\*+')
+_UNDERSCORE_EMPHASIS_RE = re.compile(r'_+([^_]+)_+')
+
+
 @dataclass
 class BlogContentMetrics:
     """Metrics extracted from blog content markdown"""
@@ -64,9 +75,6 @@ def analyze_content_structure(content: str) -> BlogContentMetrics:
     lines = content.strip().split('\n')
     
     # Count H2 and H3 headings
-    h2_pattern = re.compile(r'^##\s+(.+)$')
-    h3_pattern = re.compile(r'^###\s+(.+)$')
-    
     h2_count = 0
     h3_count = 0
     heading_titles = []
@@ -74,8 +82,8 @@ def analyze_content_structure(content: str) -> BlogContentMetrics:
     last_h2_line = -1
     
     for i, line in enumerate(lines):
-        h2_match = h2_pattern.match(line.strip())
-        h3_match = h3_pattern.match(line.strip())
+        h2_match = _H2_PATTERN.match(line.strip())
+        h3_match = _H3_PATTERN.match(line.strip())
         
         if h2_match:
             h2_count += 1
@@ -123,19 +131,19 @@ def analyze_content_structure(content: str) -> BlogContentMetrics:
     # Remove markdown formatting for accurate word count
     text_content = content
     # Remove code blocks
-    text_content = re.sub(r'```[\s\S]*?```', '', text_content)
+    text_content = _CODE_BLOCK_RE.sub('', text_content)
     # Remove inline code
-    text_content = re.sub(r'`[^`]+`', '', text_content)
+    text_content = _INLINE_CODE_RE.sub('', text_content)
     # Remove markdown links but keep link text
-    text_content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text_content)
+    text_content = _LINK_RE.sub(r'\1', text_content)
     # Remove headings markers
-    text_content = re.sub(r'^#+\s+', '', text_content, flags=re.MULTILINE)
+    text_content = _HEADING_MARKER_RE.sub('', text_content)
     # Remove bold/italic markers
-    text_content = re.sub(r'\*+([^*]+)\*+', r'\1', text_content)
-    text_content = re.sub(r'_+([^_]+)_+', r'\1', text_content)
+    text_content = _BOLD_ITALIC_RE.sub(r'\1', text_content)
+    text_content = _UNDERSCORE_EMPHASIS_RE.sub(r'\1', text_content)
     
-    words = text_content.split()
-    word_count = len([w for w in words if len(w) > 0])
+    # str.split() never yields empty strings, so no extra filtering pass is needed
+    word_count = len(text_content.split())
     
     # Check if content ends properly
     content_stripped = content.strip()
@@ -128,6 +128,11 @@ if not NEWSDATA_API_KEY:
 
 NEWSDATA_MAX_ARTICLES = int(os.getenv("NEWSDATA_MAX_ARTICLES", "20"))
 NEWSDATA_LOOKBACK_DAYS = int(os.getenv("NEWSDATA_LOOKBACK_DAYS", "2"))
+NEWS_CACHE_TTL_SECONDS = int(os.getenv("NEWS_CACHE_TTL_SECONDS", "300"))  # Reuse news context across topic attempts
+NEWS_STORE_TTL_SECONDS = int(os.getenv("NEWS_STORE_TTL_SECONDS", "3600"))  # News context shared across runs via MongoDB (0 disables)
+NEWSDATA_MAX_RETRIES = int(os.getenv("NEWSDATA_MAX_RETRIES", "3"))
+NEWSDATA_RETRY_BACKOFF = 5  # Base seconds for exponential backoff (5s, 10s, 20s... + jitter)
+NEWSDATA_RETRY_BACKOFF_MAX = 60  # Cap on a single retry wait
 
 # Application
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -173,6 +178,9 @@ MAX_TAGS_COUNT = 7
 # Uniqueness Settings
 SIMILARITY_THRESHOLD = 0.7  # Topics with >70% similarity are considered duplicates
 HISTORY_LOOKBACK_MONTHS = 6  # Check for duplicates in last 6 months
+SEMANTIC_SIMILARITY_THRESHOLD = 0.92  # Cosine similarity of title embeddings considered a duplicate
+TITLE_CACHE_TTL_SECONDS = int(os.getenv("TITLE_CACHE_TTL_SECONDS", "86400"))  # Cached title corpus lifetime
+CATEGORY_CACHE_TTL_SECONDS = int(os.getenv("CATEGORY_CACHE_TTL_SECONDS", "3600"))  # Active categories kept in memory
 
 # API Settings
 # Using Gemini 2.5 Flash model
@@ -180,9 +188,17 @@ GEMINI_MODEL = "gemini-2.5-flash"
 GEMINI_TEMPERATURE = 0.7
 GEMINI_MAX_TOKENS_TOPICS = 4000
 GEMINI_MAX_TOKENS_BLOG = 16384  # Increased to prevent truncation of blog content (Gemini 2.5 Flash max)
+GEMINI_EMBEDDING_MODEL = "models/gemini-embedding-001"  # Embeddings for semantic uniqueness (text-embedding-004 is retired)
+GEMINI_EMBEDDING_DIMENSIONS = 768  # Truncated output size; vectors are re-normalized before comparison
 API_TIMEOUT = 60
 API_MAX_RETRIES = 3
 
+# Rate Limits (requests per minute per upstream service)
+GEMINI_RPM = int(os.getenv("GEMINI_RPM", "5"))
+GEMINI_EMBEDDING_RPM = int(os.getenv("GEMINI_EMBEDDING_RPM", "100"))  # Separate quota from generation
+NEWSDATA_RPM = int(os.getenv("NEWSDATA_RPM", "10"))
+HASHNODE_RPM = int(os.getenv("HASHNODE_RPM", "10"))
+
 # AWS S3 Upload Service
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
@@ -213,8 +229,9 @@ if _user_wants_images and not _aws_credentials_available:
     )
 
 # MongoDB Connection Settings
-MONGODB_MAX_POOL_SIZE = 10
-MONGODB_MIN_POOL_SIZE = 1
+# Size the pool for concurrent publication steps (worker threads share one client)
+MONGODB_MAX_POOL_SIZE = int(os.getenv("MONGODB_MAX_POOL_SIZE", "10"))
+MONGODB_MIN_POOL_SIZE = int(os.getenv("MONGODB_MIN_POOL_SIZE", "1"))
 MONGODB_SERVER_SELECTION_TIMEOUT = 30000  # milliseconds
 
 # Content Angles
@@ -273,6 +290,11 @@ class Settings:
     # NewsData
     NEWSDATA_MAX_ARTICLES = NEWSDATA_MAX_ARTICLES
     NEWSDATA_LOOKBACK_DAYS = NEWSDATA_LOOKBACK_DAYS
+    NEWS_CACHE_TTL_SECONDS = NEWS_CACHE_TTL_SECONDS
+    NEWS_STORE_TTL_SECONDS = NEWS_STORE_TTL_SECONDS
+    NEWSDATA_MAX_RETRIES = NEWSDATA_MAX_RETRIES
+    NEWSDATA_RETRY_BACKOFF = NEWSDATA_RETRY_BACKOFF
+    NEWSDATA_RETRY_BACKOFF_MAX = NEWSDATA_RETRY_BACKOFF_MAX
 
     # Content Settings
     TOPIC_COUNT_PER_WEEK = TOPIC_COUNT_PER_WEEK
@@ -287,15 +309,26 @@ class Settings:
     # Uniqueness
     SIMILARITY_THRESHOLD = SIMILARITY_THRESHOLD
     HISTORY_LOOKBACK_MONTHS = HISTORY_LOOKBACK_MONTHS
+    SEMANTIC_SIMILARITY_THRESHOLD = SEMANTIC_SIMILARITY_THRESHOLD
+    TITLE_CACHE_TTL_SECONDS = TITLE_CACHE_TTL_SECONDS
+    CATEGORY_CACHE_TTL_SECONDS = CATEGORY_CACHE_TTL_SECONDS
 
     # Gemini AI
     GEMINI_MODEL = GEMINI_MODEL
     GEMINI_TEMPERATURE = GEMINI_TEMPERATURE
     GEMINI_MAX_TOKENS_TOPICS = GEMINI_MAX_TOKENS_TOPICS
     GEMINI_MAX_TOKENS_BLOG = GEMINI_MAX_TOKENS_BLOG
+    GEMINI_EMBEDDING_MODEL = GEMINI_EMBEDDING_MODEL
+    GEMINI_EMBEDDING_DIMENSIONS = GEMINI_EMBEDDING_DIMENSIONS
     API_TIMEOUT = API_TIMEOUT
     API_MAX_RETRIES = API_MAX_RETRIES
 
+    # Rate Limits
+    GEMINI_RPM = GEMINI_RPM
+    GEMINI_EMBEDDING_RPM = GEMINI_EMBEDDING_RPM
+    NEWSDATA_RPM = NEWSDATA_RPM
+    HASHNODE_RPM = HASHNODE_RPM
+
     # Images
     ENABLE_BLOG_IMAGES = ENABLE_BLOG_IMAGES
     IMAGE_GENERATION_ENABLED = IMAGE_GENERATION_ENABLED
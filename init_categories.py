@@ -5,7 +5,7 @@ Run this once to set up your categories
 """
 import sys
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 sys.path.insert(0, '/home/shivam/App/Work/Phrase_trade/Blog-Automation')
 
@@ -62,11 +62,12 @@ def init_categories(force: bool = False):
                     return EXIT_CANCELLED
 
         # Insert categories
+        now = datetime.now(timezone.utc)
         for cat in categories:
             cat['usage_count'] = 0
             cat['last_used_date'] = None
-            cat['created_at'] = datetime.utcnow()
-            cat['updated_at'] = datetime.utcnow()
+            cat['created_at'] = now
+            cat['updated_at'] = now
 
         result = db.categories.insert_many(categories)
         print(f"✓ Inserted {len(result.inserted_ids)} categories:")
@@ -16,22 +16,30 @@ Workflow:
 
 import sys
 import time
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, List, Tuple
 import random
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to the path
 sys.path.insert(0, '/home/shivam/App/Work/Phrase_trade/Blog-Automation')
 
 from config.settings import settings
 from app.models.database import get_sync_db
-from app.services.gemini_service import GeminiService
-from app.services.newsdata_service import NewsDataService
-from app.services.hashnode_service import HashnodeService
-from app.services.image_upload_service import ImageUploadService
-from app.utils.uniqueness import calculate_similarity, generate_topic_hash
+from app.utils.uniqueness import (
+    generate_topic_hash,
+    preprocess_title,
+    TitleIndex,
+    normalize_embeddings,
+    max_cosine_similarity
+)
+from app.utils.rate_limiter import RateLimiter
 from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import OperationFailure
+import numpy as np
 
 # Exit codes
 EXIT_SUCCESS = 0
@@ -42,6 +50,12 @@ EXIT_NO_UNIQUE_TOPIC = 4
 EXIT_BLOG_GENERATION_FAILED = 5
 EXIT_PUBLISH_FAILED = 6
 
+# Cache key for the preprocessed title corpus (one entry per similarity method)
+TITLE_CACHE_KEY = "fuzzy_titles:combined:v2"
+
+# Cache key for the NewsData context (tech news, same for every category)
+NEWS_CACHE_KEY = "news_context:technology"
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO,
@@ -55,9 +69,6 @@ class BlogAutomationRunner:
 
     def __init__(self):
         self.db = get_sync_db()
-        self.gemini = GeminiService()
-        self.news_service = NewsDataService()
-        self.image_service = ImageUploadService()
         self.publications = settings.HASHNODE_PUBLICATIONS
 
         # Validate publications
@@ -68,24 +79,100 @@ class BlogAutomationRunner:
         for pub in self.publications:
             logger.info(f"  - {pub.name}: {len(pub.categories)} categories")
 
+        # One Hashnode client per publication, created on first publish (see _get_hashnode_client)
+        self._hashnode_clients: Dict[str, Any] = {}
+
         # Configuration
         self.max_topic_attempts = 5
         self.similarity_threshold = settings.SIMILARITY_THRESHOLD
-        self.sleep_duration = random.randint(10, 30)  # 10-30 seconds
+        self.lookback_days = settings.HISTORY_LOOKBACK_MONTHS * 30
+        self.semantic_threshold = settings.SEMANTIC_SIMILARITY_THRESHOLD
+
+        # Title embeddings (unit rows) loaded once per run, extended by store_topic
+        self.topic_embeddings: Optional[np.ndarray] = None
+        self.embedding_titles: List[str] = []
+        self._candidate_embeddings: Dict[str, np.ndarray] = {}
+        # Cleared after the first failed embedding call; the semantic check is then
+        # skipped for the rest of the run instead of failing again on every topic
+        self._embeddings_available = True
+
+        # Keyword index over the title corpus, built once per run (see _get_title_index)
+        self._title_index: Optional[TitleIndex] = None
+
+        # Active categories cache, see _get_active_categories
+        self._categories: Optional[List[Dict[str, Any]]] = None
+        self._categories_loaded_at = 0.0
+
+        # News context per category: (fetched_at, context), see _get_news_context
+        self._news_cache: Dict[str, Tuple[float, str]] = {}
+
+        # Per-service request caps (requests per minute) enforced by _pace();
+        # Gemini paces its own generation calls inside GeminiService, while
+        # embeddings have their own quota and are paced here
+        self.rate_limiters = {
+            "newsdata": RateLimiter(settings.NEWSDATA_RPM, "newsdata"),
+            "hashnode": RateLimiter(settings.HASHNODE_RPM, "hashnode"),
+            "gemini_embedding": RateLimiter(settings.GEMINI_EMBEDDING_RPM, "gemini embedding"),
+        }
 
-    def sleep(self, message: str = ""):
-        """Sleep with a message"""
-        duration = random.randint(10, 30)
-        if message:
-            logger.info(f"{message} (sleeping for {duration}s)")
-        else:
-            logger.info(f"Sleeping for {duration} seconds...")
-        time.sleep(duration)
+        # Heavy services are imported and created on first use (see properties below)
+        self._gemini = None
+        self._news_service = None
+        self._image_service = None
+
+    @property
+    def gemini(self):
+        """Gemini AI service (google-generativeai is imported on first use)"""
+        if self._gemini is None:
+            from app.services.gemini_service import GeminiService
+            self._gemini = GeminiService()
+        return self._gemini
+
+    @property
+    def news_service(self):
+        """NewsData.io service (created on first use)"""
+        if self._news_service is None:
+            from app.services.newsdata_service import NewsDataService
+            self._news_service = NewsDataService()
+        return self._news_service
+
+    @property
+    def image_service(self):
+        """Image upload service (boto3 is imported on first use)"""
+        if self._image_service is None:
+            from app.services.image_upload_service import ImageUploadService
+            self._image_service = ImageUploadService()
+        return self._image_service
+
+    def _pace(self, service_name: str):
+        """
+        Sleep only as long as needed to respect a service's RPM cap
+
+        Args:
+            service_name: Key into self.rate_limiters (newsdata, hashnode, gemini_embedding)
+        """
+        self.rate_limiters[service_name].acquire()
+
+    def _get_active_categories(self) -> List[Dict[str, Any]]:
+        """
+        Active categories, loaded once and refreshed every CATEGORY_CACHE_TTL_SECONDS
+
+        Categories rarely change, so every publication in a run picks from the same list.
+        """
+        if self._categories is None or time.monotonic() - self._categories_loaded_at > settings.CATEGORY_CACHE_TTL_SECONDS:
+            self._categories = list(self.db.categories.find(
+                {"is_active": True},
+                {"name": 1, "description": 1}
+            ))
+            self._categories_loaded_at = time.monotonic()
+            logger.info(f"📁 Loaded {len(self._categories)} active categories")
+
+        return self._categories
 
     def get_random_category(self) -> Dict[str, Any]:
         """Get a random category from database (legacy method for backward compatibility)"""
         logger.info("📁 Fetching a random category...")
-        categories = list(self.db.categories.find({"is_active": True}))
+        categories = self._get_active_categories()
 
         if not categories:
             logger.error("No active categories found in database")
@@ -106,47 +193,91 @@ class BlogAutomationRunner:
         Returns:
             Category dict or None if no categories available
         """
+        categories = self._get_active_categories()
+
         # If publication has specific categories, filter by them
         if publication.categories:
-            categories = list(self.db.categories.find({
-                "is_active": True,
-                "name": {"$in": publication.categories}
-            }))
-        else:
-            # Legacy mode: all categories
-            categories = list(self.db.categories.find({"is_active": True}))
+            allowed = set(publication.categories)
+            categories = [c for c in categories if c['name'] in allowed]
+        # Otherwise legacy mode: all categories
 
-        if not categories:
+        category = random.choice(categories) if categories else None
+
+        if not category:
             logger.warning(f"No active categories found for publication: {publication.name}")
             return None
 
-        category = random.choice(categories)
         logger.info(f"✓ Selected category: {category['name']} for {publication.name}")
         return category
 
-    def generate_topic(self, category_name: str, category_description: str = "") -> Optional[str]:
-        """Generate a single topic using Gemini AI"""
-        logger.info(f"🤖 Generating topic for category: {category_name}")
+    def _get_news_context(self, category_name: str) -> str:
+        """
+        Get trending news context for a category, cached for NEWS_CACHE_TTL_SECONDS
+
+        Every topic attempt for the same category reuses one NewsData response.
+        Successful responses are also stored in the `cache` collection for
+        NEWS_STORE_TTL_SECONDS, so reruns and later publications skip the fetch.
+        """
+        cached = self._news_cache.get(category_name)
+        if cached and time.monotonic() - cached[0] < settings.NEWS_CACHE_TTL_SECONDS:
+            logger.info("📰 Using cached tech news context")
+            return cached[1]
+
+        now = datetime.now(timezone.utc)
+        stored = None
+        if settings.NEWS_STORE_TTL_SECONDS > 0:
+            stored = self.db.cache.find_one({
+                "_id": NEWS_CACHE_KEY,
+                "expires_at": {"$gt": now}
+            })
+
+        if stored:
+            logger.info("📦 Using stored tech news context")
+            news_context = stored['context']
+        else:
+            logger.info("📰 Fetching trending tech news...")
+            self._pace("newsdata")
+            news_context = self.news_service.get_news_context(category_name)
+
+            # An empty context means the fetch failed; let the next run retry it
+            if news_context and settings.NEWS_STORE_TTL_SECONDS > 0:
+                self.db.cache.replace_one(
+                    {"_id": NEWS_CACHE_KEY},
+                    {
+                        "context": news_context,
+                        "expires_at": now + timedelta(seconds=settings.NEWS_STORE_TTL_SECONDS)
+                    },
+                    upsert=True
+                )
+
+        self._news_cache[category_name] = (time.monotonic(), news_context)
+        return news_context
 
-        # Fetch trending news context
-        logger.info("📰 Fetching trending tech news...")
-        news_context = self.news_service.get_news_context(category_name)
+    def generate_topic(
+        self,
+        category_name: str,
+        category_description: str = "",
+        existing_titles: Optional[List[str]] = None
+    ) -> Optional[str]:
+        """
+        Generate a single topic using Gemini AI
 
-        from datetime import timedelta
-        lookback_date = datetime.now(timezone.utc) - timedelta(days=180)
-        historical_topics = list(self.db.topics.find({
-            "created_at": {"$gte": lookback_date}
-        }))
-        existing_topic_titles = [topic['title'] for topic in historical_topics]
+        Args:
+            category_name: Category name
+            category_description: Category description
+            existing_titles: Recent topic titles for Gemini to avoid (from _get_recent_titles)
+        """
+        logger.info(f"🤖 Generating topic for category: {category_name}")
 
-        self.sleep("News fetched successfully")
+        # Fetch trending news context (cached across attempts)
+        news_context = self._get_news_context(category_name)
 
         # Generate topics (we'll use just the first one)
         logger.info("🎯 Calling Gemini AI to generate topic...")
         topics = self.gemini.generate_topics(
             category_name=category_name,
             category_description=category_description or f"Content about {category_name}",
-            existing_topics=existing_topic_titles,
+            existing_topics=existing_titles or [],
             count=1,
             news_context=news_context
         )
@@ -160,104 +291,329 @@ class BlogAutomationRunner:
         logger.info(f"✓ Generated topic: {topic}")
         return topic
 
+    def _lookback_date(self) -> datetime:
+        """Start of the duplicate-check window (HISTORY_LOOKBACK_MONTHS)"""
+        return datetime.now(timezone.utc) - timedelta(days=self.lookback_days)
+
+    def _load_title_corpus(self) -> List[Dict[str, str]]:
+        """
+        Load the preprocessed title corpus used for uniqueness checks
+
+        The corpus (topics + generation history from the last 6 months) is
+        cached as a single document in the `cache` collection so warm runs
+        skip the full collection scans and re-normalization.
+
+        Returns:
+            List of preprocess_title dicts (title, normalized, keywords, source)
+        """
+        now = datetime.now(timezone.utc)
+        cached = self.db.cache.find_one({
+            "_id": TITLE_CACHE_KEY,
+            "expires_at": {"$gt": now}
+        })
+        if cached:
+            logger.info(f"📦 Using cached title corpus ({len(cached['titles'])} titles)")
+            return cached['titles']
+
+        lookback_date = self._lookback_date()
+
+        corpus = []
+        # Project to the title fields only; iterate the cursors without materializing
+        for existing in self.db.topics.find(
+            {"created_at": {"$gte": lookback_date}},
+            {"title": 1, "_id": 0}
+        ):
+            corpus.append(preprocess_title(existing['title'], source="topic"))
+
+        for record in self.db.generation_history.find(
+            {"generated_at": {"$gte": lookback_date}},
+            {"generated_topics": 1, "_id": 0}
+        ):
+            for generated_topic in record.get('generated_topics', []):
+                corpus.append(preprocess_title(generated_topic, source="history"))
+
+        self.db.cache.replace_one(
+            {"_id": TITLE_CACHE_KEY},
+            {
+                "titles": corpus,
+                "expires_at": now + timedelta(seconds=settings.TITLE_CACHE_TTL_SECONDS)
+            },
+            upsert=True
+        )
+        return corpus
+
+    def _get_title_index(self) -> TitleIndex:
+        """Build the keyword index over the title corpus once and reuse it across attempts"""
+        if self._title_index is None:
+            self._title_index = TitleIndex(self._load_title_corpus())
+        return self._title_index
+
+    def _get_recent_titles(self) -> List[str]:
+        """Get titles of topics stored in the last 6 months (from the title index)"""
+        return [entry['title'] for entry in self._get_title_index().titles if entry['source'] == "topic"]
+
     def is_topic_unique(self, topic: str) -> bool:
         """Check if topic is unique compared to existing topics in DB"""
         logger.info(f"🔍 Checking uniqueness for: {topic}")
 
-        # Get historical topics (last 6 months)
-        from datetime import timedelta
-        lookback_date = datetime.now(timezone.utc) - timedelta(days=180)
+        index = self._get_title_index()
+        candidate = preprocess_title(topic)
+
+        # Most duplicates are exact after normalization: set lookup, no DB or similarity work
+        existing = index.find_exact(candidate)
+        if existing:
+            logger.warning(f"❌ Topic is an exact duplicate of: {existing['title']}")
+            return False
 
-        historical_topics = list(self.db.topics.find({
-            "created_at": {"$gte": lookback_date}
-        }))
+        # Exact (normalized keyword) duplicates outside the lookback window: indexed hash lookups
+        topic_hash = generate_topic_hash(topic)
+        if (self.db.topics.find_one({"hash": topic_hash}, {"_id": 1})
+                or self.db.generation_history.find_one({"topic_hash": topic_hash}, {"_id": 1})):
+            logger.warning(f"❌ Topic is an exact duplicate (hash {topic_hash[:12]}...)")
+            return False
 
-        # Also check generation history
-        history_records = list(self.db.generation_history.find({
-            "generated_at": {"$gte": lookback_date}
-        }))
+        logger.info(f"📊 Comparing against {len(index)} historical titles")
 
-        logger.info(f"📊 Comparing against {len(historical_topics)} topics and {len(history_records)} history records")
+        match = index.find_similar(candidate, self.similarity_threshold)
+        if match:
+            existing, similarity = match
+            label = "historical: " if existing['source'] == "history" else ""
+            logger.warning(f"❌ Topic too similar ({similarity:.2%}) to {label}{existing['title']}")
+            return False
 
-        # Check against topics
-        for existing in historical_topics:
-            similarity = calculate_similarity(topic, existing['title'], method="combined")
-            if similarity >= self.similarity_threshold:
-                logger.warning(f"❌ Topic too similar ({similarity:.2%}) to: {existing['title']}")
+        # Semantic check: catches rewrites that string similarity misses
+        query = self._embed_topic(topic)
+        if query is not None:
+            similarity, idx = max_cosine_similarity(self._load_topic_embeddings(), query)
+            if similarity > self.semantic_threshold:
+                logger.warning(f"❌ Topic semantically similar ({similarity:.2%}) to: {self.embedding_titles[idx]}")
                 return False
 
-        # Check against generation history
-        for record in history_records:
-            for generated_topic in record.get('generated_topics', []):
-                similarity = calculate_similarity(topic, generated_topic, method="combined")
-                if similarity >= self.similarity_threshold:
-                    logger.warning(f"❌ Topic too similar ({similarity:.2%}) to historical: {generated_topic}")
-                    return False
-
         logger.info("✓ Topic is unique!")
         return True
 
+    def _load_topic_embeddings(self) -> np.ndarray:
+        """
+        Load stored topic embeddings (last 6 months) as a unit-normalized matrix
+
+        Returns:
+            Array of shape (N, dim); shape (0, 0) if no topic has an embedding yet
+        """
+        if self.topic_embeddings is None:
+            lookback_date = self._lookback_date()
+
+            vectors = []
+            missing = []
+            for doc in self.db.topics.find(
+                {"created_at": {"$gte": lookback_date}},
+                {"title": 1, "embedding": 1, "embedding_model": 1}
+            ):
+                # Vectors from another embedding model are not comparable; re-embed them
+                if doc.get('embedding') and doc.get('embedding_model') == settings.GEMINI_EMBEDDING_MODEL:
+                    self.embedding_titles.append(doc['title'])
+                    vectors.append(doc['embedding'])
+                else:
+                    missing.append(doc)
+
+            # Topics stored before embeddings existed (or whose embedding call failed,
+            # or embedded with an older model) are embedded once here and persisted,
+            # so later runs only read them
+            if missing and self._embeddings_available:
+                for title, vector in self._backfill_topic_embeddings(missing):
+                    self.embedding_titles.append(title)
+                    vectors.append(vector)
+
+            if vectors:
+                self.topic_embeddings = normalize_embeddings(vectors)
+            else:
+                self.topic_embeddings = np.zeros((0, 0), dtype=np.float32)
+            logger.info(f"📐 Loaded {len(vectors)} topic embeddings")
+
+        return self.topic_embeddings
+
+    def _backfill_topic_embeddings(self, docs: List[Dict[str, Any]]) -> List[Tuple[str, List[float]]]:
+        """
+        Embed stored topics that have no embedding yet and save the vectors
+
+        Args:
+            docs: Topic documents with "_id" and "title"
+
+        Returns:
+            (title, embedding) pairs for the topics that were embedded
+        """
+        embedded = []
+        batch_size = 100  # Gemini batch embedding limit per request
+
+        for start in range(0, len(docs), batch_size):
+            batch = docs[start:start + batch_size]
+            try:
+                self._pace("gemini_embedding")
+                batch_vectors = self.gemini.embed_texts([doc['title'] for doc in batch])
+            except Exception as e:
+                logger.warning(f"Embedding backfill failed, skipping semantic checks this run: {e}")
+                self._embeddings_available = False
+                break
+
+            self.db.topics.bulk_write(
+                [
+                    UpdateOne(
+                        {"_id": doc['_id']},
+                        {"$set": {"embedding": vector, "embedding_model": settings.GEMINI_EMBEDDING_MODEL}}
+                    )
+                    for doc, vector in zip(batch, batch_vectors)
+                ],
+                ordered=False
+            )
+            embedded.extend((doc['title'], vector) for doc, vector in zip(batch, batch_vectors))
+
+        if embedded:
+            logger.info(f"📐 Backfilled embeddings for {len(embedded)} stored topics")
+        return embedded
+
+    def _embed_topic(self, topic: str) -> Optional[np.ndarray]:
+        """
+        Embed a candidate topic once (reused by store_topic)
+
+        Returns:
+            Unit-normalized embedding, or None if embeddings are unavailable this run
+        """
+        if topic not in self._candidate_embeddings:
+            if not self._embeddings_available:
+                return None
+            try:
+                self._pace("gemini_embedding")
+                vector = self.gemini.embed_texts([topic])[0]
+            except Exception as e:
+                logger.warning(f"Embedding failed, skipping semantic checks this run: {e}")
+                self._embeddings_available = False
+                return None
+            self._candidate_embeddings[topic] = normalize_embeddings(vector)[0]
+
+        return self._candidate_embeddings[topic]
+
     def find_unique_topic(self, category_name: str, category_description: str = "") -> Optional[str]:
         """Keep generating topics until we find a unique one"""
         logger.info(f"🔄 Starting unique topic search (max {self.max_topic_attempts} attempts)...")
 
+        # Load the title index, embeddings and news context once, concurrently
+        # (independent Mongo/HTTP I/O); every attempt below is served from memory
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            titles_future = pool.submit(self._get_recent_titles)
+            embeddings_future = pool.submit(self._load_topic_embeddings)
+            news_future = pool.submit(self._get_news_context, category_name)
+            existing_titles = titles_future.result()
+            embeddings_future.result()
+            news_future.result()
+
         for attempt in range(1, self.max_topic_attempts + 1):
             logger.info(f"\n--- Attempt {attempt}/{self.max_topic_attempts} ---")
 
             # Generate topic
-            topic = self.generate_topic(category_name, category_description)
+            topic = self.generate_topic(category_name, category_description, existing_titles)
             if not topic:
                 logger.warning("Failed to generate topic, trying again...")
-                self.sleep("Waiting before retry")
                 continue
 
-            self.sleep("Topic generated, checking uniqueness")
-
             # Check uniqueness
             if self.is_topic_unique(topic):
                 logger.info(f"🎉 Found unique topic on attempt {attempt}!")
                 return topic
             else:
                 logger.info(f"Topic is duplicate, will try again...")
-                self.sleep("Waiting before next attempt")
 
         logger.error(f"❌ Could not find unique topic after {self.max_topic_attempts} attempts")
         return None
 
+    def _run_in_transaction(self, write_fn) -> None:
+        """
+        Run related writes atomically in one transaction.
+
+        Transactions need a replica set; on a standalone server the writes
+        run one after another without a session instead.
+
+        Args:
+            write_fn: Callable taking a ``session`` keyword argument
+        """
+        client = self.db.client
+        try:
+            with client.start_session() as session:
+                session.with_transaction(lambda s: write_fn(session=s))
+        except OperationFailure as e:
+            # 20 = IllegalOperation ("Transaction numbers are only allowed on a replica set member or mongos")
+            if e.code != 20:
+                raise
+            logger.debug("MongoDB transactions unavailable, writing without a session")
+            write_fn(session=None)
+
     def store_topic(self, topic: str, category: Dict[str, Any]) -> str:
         """Store topic in database"""
         logger.info("💾 Storing topic in database...")
+        now = datetime.now(timezone.utc)
 
         topic_doc = {
             "title": topic,
             "category_id": category['_id'],
             "category_name": category['name'],
             "status": "PENDING",
-            "scheduled_date": datetime.now(timezone.utc),
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc),
+            "scheduled_date": now,
+            "created_at": now,
+            "updated_at": now,
             "hash": generate_topic_hash(topic)
         }
 
-        result = self.db.topics.insert_one(topic_doc)
-        topic_id = str(result.inserted_id)
-
-        logger.info(f"✓ Topic stored with ID: {topic_id}")
+        embedding = self._embed_topic(topic)
+        if embedding is not None:
+            topic_doc["embedding"] = embedding.tolist()
+            topic_doc["embedding_model"] = settings.GEMINI_EMBEDDING_MODEL
 
         # Also update generation history
         history_doc = {
             "category_id": category['_id'],
             "category_name": category['name'],
             "generated_topics": [topic],
-            "generated_at": datetime.now(timezone.utc)
+            "topic_hash": topic_doc["hash"],
+            "generated_at": now
         }
-        self.db.generation_history.insert_one(history_doc)
+
+        def write_topic(session=None):
+            self.db.topics.insert_one(topic_doc, session=session)
+            self.db.generation_history.insert_one(history_doc, session=session)
+
+        self._run_in_transaction(write_topic)
+
+        # insert_one sets _id on the document in place
+        topic_id = str(topic_doc["_id"])
+        logger.info(f"✓ Topic stored with ID: {topic_id}")
+
+        # Keep the cached title corpus and in-memory index warm instead of invalidating them
+        new_titles = [
+            preprocess_title(topic, source="topic"),
+            preprocess_title(topic, source="history")
+        ]
+        if self._title_index is not None:
+            for title in new_titles:
+                self._title_index.add(title)
+
+        # expires_at is left alone so the corpus is still rebuilt every TTL, which
+        # drops titles older than the lookback window and bounds the document size
+        self.db.cache.update_one(
+            {"_id": TITLE_CACHE_KEY},
+            {"$push": {"titles": {"$each": new_titles}}}
+        )
+
+        # Make the new embedding visible to later uniqueness checks in this run
+        if embedding is not None and self.topic_embeddings is not None:
+            if self.topic_embeddings.shape[0] == 0:
+                self.topic_embeddings = embedding[np.newaxis, :]
+            else:
+                self.topic_embeddings = np.vstack([self.topic_embeddings, embedding])
+            self.embedding_titles.append(topic)
 
         return topic_id
     
-    def generate_image_with_retry(self, topic: str, category_name: str, api_token: str) -> Optional[str]:
+    async def generate_image_with_retry(self, topic: str, category_name: str, api_token: str) -> Optional[str]:
         """
-        Generate image with retry logic:
+        Generate image with retry logic (coroutine; waits do not block the event loop):
         Fail 1 -> wait 2m -> retry
         Fail 2 -> wait 5m -> retry
         Fail 3 -> wait 10m -> retry
@@ -284,13 +640,16 @@ class BlogAutomationRunner:
             try:
                 logger.info(f"Image generation attempt {attempt}/{max_attempts}")
 
-                # 1. Generate Image (returns local path)
-                local_path = self.gemini.generate_blog_cover_image(
+                # 1. Generate Image (in memory, no temp file)
+                image = await asyncio.to_thread(
+                    self.gemini.generate_blog_cover_image_bytes,
                     blog_title=topic,
                     keywords=[category_name]
                 )
 
-                if local_path:
+                if image:
+                    image_data, content_type = image
+
                     # 2. Upload to both S3 and Hashnode CDN
                     logger.info("☁️ Uploading image to S3 and Hashnode CDN...")
 
@@ -301,9 +660,11 @@ class BlogAutomationRunner:
                             jwt_token = pub.jwt_token
                             break
 
-                    result = self.image_service.upload_and_cleanup(
-                        local_path,
+                    result = await asyncio.to_thread(
+                        self.image_service.upload_bytes,
+                        image_data,
                         title=topic,
+                        content_type=content_type,
                         upload_to="both",
                         hashnode_api_token=api_token,
                         hashnode_jwt_token=jwt_token
@@ -322,7 +683,7 @@ class BlogAutomationRunner:
                     else:
                         logger.warning("Failed to upload image to any CDN")
                 else:
-                    logger.warning("Failed to generate image (no path returned)")
+                    logger.warning("Failed to generate image (no data returned)")
 
             except Exception as e:
                 logger.error(f"Image generation error: {e}")
@@ -332,12 +693,47 @@ class BlogAutomationRunner:
                 wait_time = retry_delays[attempt - 1]
                 minutes = wait_time // 60
                 logger.warning(f"⚠️ Image generation failed. Retrying in {minutes} minutes...")
-                time.sleep(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 logger.error("❌ All image generation attempts failed. Proceeding without image.")
 
         return None
 
+    async def generate_image_and_blog(
+        self,
+        topic_id: str,
+        topic: str,
+        category: Dict[str, Any],
+        api_token: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Generate the cover image and the blog content concurrently
+
+        Both only depend on the topic, so the image retry waits overlap with
+        blog generation instead of adding to it.
+
+        Returns:
+            Tuple of (cover image URL or None, blog data or None)
+
+        Raises:
+            Exception: If blog generation raised (image errors are logged and ignored)
+        """
+        cover_image_url, blog_data = await asyncio.gather(
+            self.generate_image_with_retry(topic, category['name'], api_token=api_token),
+            asyncio.to_thread(self.generate_blog, topic_id, topic, category),
+            return_exceptions=True
+        )
+
+        if isinstance(cover_image_url, Exception):
+            logger.error(f"Image generation failed: {cover_image_url}")
+            # Continue without image
+            cover_image_url = None
+
+        if isinstance(blog_data, Exception):
+            raise blog_data
+
+        return cover_image_url, blog_data
+
     def generate_blog(self, topic_id: str, topic_title: str, category: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Generate blog content using Gemini AI"""
         logger.info(f"📝 Generating blog content for: {topic_title}")
@@ -370,6 +766,7 @@ class BlogAutomationRunner:
     def store_blog(self, blog_data: Dict[str, Any], topic_id: str, category: Dict[str, Any], cover_image_url: Optional[str] = None) -> str:
         """Store blog in database"""
         logger.info("💾 Storing blog in database...")
+        now = datetime.now(timezone.utc)
 
         blog_doc = {
             "topic_id": ObjectId(topic_id),
@@ -383,8 +780,8 @@ class BlogAutomationRunner:
             "word_count": blog_data.get('word_count', 0),
             "status": "DRAFT",
             "cover_image_url": cover_image_url,
-            "created_at": datetime.now(timezone.utc),
-            "updated_at": datetime.now(timezone.utc)
+            "created_at": now,
+            "updated_at": now
         }
 
         result = self.db.blogs.insert_one(blog_doc)
@@ -418,6 +815,7 @@ class BlogAutomationRunner:
                 logger.info(f"   URL: {post_url}")
 
                 # Update blog in database
+                now = datetime.now(timezone.utc)
                 self.db.blogs.update_one(
                     {"_id": ObjectId(blog_id)},
                     {
@@ -425,8 +823,8 @@ class BlogAutomationRunner:
                             "status": "PUBLISHED",
                             "hashnode_post_id": post_id,
                             "hashnode_url": post_url,
-                            "published_at": datetime.now(timezone.utc),
-                            "updated_at": datetime.now(timezone.utc)
+                            "published_at": now,
+                            "updated_at": now
                         }
                     }
                 )
@@ -440,6 +838,22 @@ class BlogAutomationRunner:
             logger.error(f"❌ Error during publishing: {str(e)}")
             return False
 
+    def _get_hashnode_client(self, publication):
+        """
+        Get the Hashnode client for a publication, creating it on first use
+
+        Created lazily so a publication with missing credentials only fails its
+        own publish instead of the whole run.
+        """
+        if publication.publication_id not in self._hashnode_clients:
+            from app.services.hashnode_service import HashnodeService
+            self._hashnode_clients[publication.publication_id] = HashnodeService(
+                api_token=publication.api_token,
+                publication_id=publication.publication_id,
+                publication_name=publication.name
+            )
+        return self._hashnode_clients[publication.publication_id]
+
     def publish_blog_to_publication(
         self,
         publication,
@@ -460,14 +874,11 @@ class BlogAutomationRunner:
         logger.info(f"🚀 Publishing to {publication.name}...")
 
         try:
-            # Create publication-specific Hashnode service
-            hashnode = HashnodeService(
-                api_token=publication.api_token,
-                publication_id=publication.publication_id,
-                publication_name=publication.name
-            )
+            # Reuse the publication-specific Hashnode service
+            hashnode = self._get_hashnode_client(publication)
 
             # Publish
+            self._pace("hashnode")
             result = hashnode.publish_post(
                 title=blog_data['title'],
                 content=blog_data['content'],
@@ -511,71 +922,59 @@ class BlogAutomationRunner:
                 logger.error(f"❌ No categories available for {publication.name}")
                 return False
 
-            self.sleep("Category selected")
-
             # Step 2: Find unique topic
             topic = self.find_unique_topic(category['name'], category.get('description', ''))
             if not topic:
                 logger.error(f"❌ Could not find unique topic for {publication.name}")
                 return False
 
-            self.sleep("Unique topic found")
-
             # Step 3: Store topic
             topic_id = self.store_topic(topic, category)
-            self.sleep("Topic stored")
 
-            # Step 4: Generate image
-            cover_image_url = None
-            try:
-                cover_image_url = self.generate_image_with_retry(
-                    topic,
-                    category['name'],
-                    api_token=publication.api_token
-                )
-            except Exception as e:
-                logger.error(f"Image generation failed: {e}")
-                # Continue without image
-
-            self.sleep("Image generation completed")
-
-            # Step 5: Generate blog content
-            blog_data = self.generate_blog(topic_id, topic, category)
+            # Steps 4 & 5: Generate image and blog content concurrently
+            cover_image_url, blog_data = asyncio.run(self.generate_image_and_blog(
+                topic_id,
+                topic,
+                category,
+                api_token=publication.api_token
+            ))
             if not blog_data:
                 logger.error(f"❌ Could not generate blog for {publication.name}")
                 return False
 
-            self.sleep("Blog content generated")
-
             # Step 6: Store blog in database (before publishing)
             blog_id = self.store_blog(blog_data, topic_id, category, cover_image_url)
-            self.sleep("Blog stored")
 
             # Step 7: Publish to this specific publication
             result = self.publish_blog_to_publication(publication, blog_data, cover_image_url)
 
             if result:
-                # Update blog with publication info
-                self.db.blogs.update_one(
-                    {"_id": ObjectId(blog_id)},
-                    {
-                        "$set": {
-                            f"publications.{publication.name}": {
-                                "status": "PUBLISHED",
-                                "hashnode_post_id": result.get('post_id'),
-                                "hashnode_url": result.get('url'),
-                                "published_at": datetime.now(timezone.utc)
-                            },
-                            "updated_at": datetime.now(timezone.utc)
-                        }
-                    }
-                )
+                # Record the publication on the blog and complete the topic atomically
+                now = datetime.now(timezone.utc)
+
+                def mark_published(session=None):
+                    self.db.blogs.update_one(
+                        {"_id": ObjectId(blog_id)},
+                        {
+                            "$set": {
+                                f"publications.{publication.name}": {
+                                    "status": "PUBLISHED",
+                                    "hashnode_post_id": result.get('post_id'),
+                                    "hashnode_url": result.get('url'),
+                                    "published_at": now
+                                },
+                                "updated_at": now
+                            }
+                        },
+                        session=session
+                    )
+                    self.db.topics.update_one(
+                        {"_id": ObjectId(topic_id)},
+                        {"$set": {"status": "COMPLETED", "updated_at": now}},
+                        session=session
+                    )
 
-                # Update topic status
-                self.db.topics.update_one(
-                    {"_id": ObjectId(topic_id)},
-                    {"$set": {"status": "COMPLETED"}}
-                )
+                self._run_in_transaction(mark_published)
 
                 logger.info(f"✅ {publication.name} - COMPLETED")
                 return True
@@ -599,7 +998,7 @@ class BlogAutomationRunner:
         logger.info(f"📊 Processing {len(self.publications)} publications")
         logger.info("=" * 60)
 
-        start_time = time.time()
+        start_time = time.monotonic()
         results = []
 
         try:
@@ -630,7 +1029,7 @@ class BlogAutomationRunner:
                     time.sleep(wait_minutes * 60)
 
             # Summary
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
             successful = sum(1 for r in results if r['success'])
             failed = len(results) - successful
 
@@ -2,10 +2,18 @@
 """
 Test script to debug Hashnode API issues
 """
+import re
 import requests
 import json
 from config import settings
 
+# Tag slug cleanup patterns, compiled once
+_INVALID_SLUG_CHARS = re.compile(r'[^a-z0-9-]')
+_REPEATED_HYPHENS = re.compile(r'-+')
+
+# GraphQL string escapes, applied in a single pass
+_GRAPHQL_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
+
 # Test data
 title = "Architecting Scalable DevOps Pipelines for 2025's Terabyte Internet Traffic Surge"
 content = "Test content"
@@ -16,16 +24,10 @@ def escape_graphql_string(text: str) -> str:
     """Escape special characters for GraphQL string"""
     if not text:
         return ""
-    text = text.replace("\\", "\\\\")
-    text = text.replace('"', '\\"')
-    text = text.replace("\n", "\\n")
-    text = text.replace("\r", "\\r")
-    text = text.replace("\t", "\\t")
-    return text
+    return text.translate(_GRAPHQL_ESCAPES)
 
 def format_tags(tags: list) -> str:
     """Format tags for GraphQL mutation - must match ^[a-z0-9-]{1,250}$"""
-    import re
     if not tags:
         return "[]"
 
@@ -36,9 +38,9 @@ def format_tags(tags: list) -> str:
         # Replace spaces with hyphens
         slug = slug.replace(" ", "-")
         # Replace any invalid characters (not a-z, 0-9, or -) with hyphens
-        slug = re.sub(r'[^a-z0-9-]', '-', slug)
+        slug = _INVALID_SLUG_CHARS.sub('-', slug)
         # Remove consecutive hyphens
-        slug = re.sub(r'-+', '-', slug)
+        slug = _REPEATED_HYPHENS.sub('-', slug)
         # Remove leading/trailing hyphens
         slug = slug.strip('-')
         # Limit to 250 characters
@@ -73,14 +75,17 @@ mutation PublishPost {{
 }}
 """
 
-print("=" * 60)
-print("Testing Hashnode API")
-print("=" * 60)
-print(f"\nPublication ID: {settings.HASHNODE_PUBLICATION_ID}")
-print(f"API URL: {settings.HASHNODE_API_URL}")
-print(f"\nMutation:")
-print(mutation)
-print("\n" + "=" * 60)
+# One write per section instead of one per line
+print("\n".join([
+    "=" * 60,
+    "Testing Hashnode API",
+    "=" * 60,
+    f"\nPublication ID: {settings.HASHNODE_PUBLICATION_ID}",
+    f"API URL: {settings.HASHNODE_API_URL}",
+    "\nMutation:",
+    mutation,
+    "\n" + "=" * 60,
+]))
 
 # Make request
 headers = {
@@ -96,10 +101,12 @@ try:
         timeout=30
     )
 
-    print(f"\nResponse Status: {response.status_code}")
-    print(f"Response Headers: {dict(response.headers)}")
-    print(f"\nResponse Body:")
-    print(json.dumps(response.json(), indent=2))
+    print("\n".join([
+        f"\nResponse Status: {response.status_code}",
+        f"Response Headers: {dict(response.headers)}",
+        "\nResponse Body:",
+        json.dumps(response.json(), indent=2),
+    ]))
 
 except Exception as e:
     print(f"\nError: {e}")
@@ -5,7 +5,12 @@ Creates a test image and uploads it to Hashnode CDN
 """
 
 import sys
-import os
+import io
+import functools
+from typing import Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image, ImageDraw, ImageFont
 
 # Add the project root to the path
@@ -17,16 +22,33 @@ from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# One pooled session for every upload in this script (TLS + keep-alive reused across retries)
+session = requests.Session()
+session.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+))
 
-def create_test_image(filename: str = "test_cover.png") -> str:
+
+@functools.lru_cache(maxsize=4)
+def _load_font(path: str, size: int):
+    """Load a TrueType font once per (path, size), falling back to the default font"""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        return ImageFont.load_default()
+
+
+def create_test_image(filename: str = "test_cover.png") -> Tuple[bytes, str]:
     """
-    Create a simple test image
+    Create a simple test image in memory (nothing is written to disk)
 
     Args:
-        filename: Output filename
+        filename: File name to upload the image as
 
     Returns:
-        Path to created image
+        Tuple of (PNG bytes, filename)
     """
     # Create a 1200x630 image (standard blog cover size)
     width, height = 1200, 630
@@ -36,12 +58,8 @@ def create_test_image(filename: str = "test_cover.png") -> str:
     draw = ImageDraw.Draw(image)
 
     # Try to use a decent font, fall back to default if not available
-    try:
-        font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
-        small_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 30)
-    except:
-        font = ImageFont.load_default()
-        small_font = ImageFont.load_default()
+    font = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
+    small_font = _load_font("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 30)
 
     # Add title text
     title = "Test Blog Cover"
@@ -51,12 +69,16 @@ def create_test_image(filename: str = "test_cover.png") -> str:
     subtitle = "Hashnode CDN Upload Test"
     draw.text((width//2, height//2 + 50), subtitle, fill='#e5e7eb', font=small_font, anchor='mm')
 
-    # Save image
-    image_path = os.path.join(os.getcwd(), filename)
-    image.save(image_path)
-    logger.info(f"Created test image: {image_path}")
+    # Flat colors + text fit an 8-bit palette; optimized PNG keeps the upload small
+    image = image.convert("P", palette=Image.Palette.ADAPTIVE, colors=16)
+
+    # Encode image
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True, compress_level=9)
+    data = buffer.getvalue()
+    logger.info(f"Created test image: {filename} ({len(data)} bytes)")
 
-    return image_path
+    return data, filename
 
 
 def test_upload():
@@ -81,16 +103,16 @@ def test_upload():
 
     # Create test image
     logger.info("Creating test image...")
-    image_path = create_test_image()
+    image_data, filename = create_test_image()
 
     try:
         # Initialize CDN service
         logger.info("Initializing Hashnode CDN service...")
-        cdn_service = HashnodeCDNService(api_token=api_token)
+        cdn_service = HashnodeCDNService(api_token=api_token, session=session)
 
         # Upload image
         logger.info("Uploading image to Hashnode CDN...")
-        cdn_url = cdn_service.upload_and_cleanup(image_path)
+        cdn_url = cdn_service.upload_image_bytes(image_data, filename)
 
         if cdn_url:
             logger.info("✅ SUCCESS!")
@@ -4,66 +4,88 @@ Quick test to check if JWT tokens are configured correctly
 """
 import sys
 import os
+import logging
+import logging.handlers
 
 sys.path.insert(0, '/home/shivam/App/Work/Phrase_trade/Blog-Automation')
 
-from config import settings
+# Report lines are buffered and written once per section (errors flush immediately)
+_console = logging.StreamHandler(sys.stdout)
+_console.setFormatter(logging.Formatter("%(message)s"))
+_log = logging.getLogger("test_jwt_setup")
+_log.setLevel(logging.INFO)
+_log.propagate = False
+_log.addHandler(logging.handlers.MemoryHandler(capacity=100, flushLevel=logging.ERROR, target=_console))
+
+
+def _flush_section():
+    """Write the buffered report lines for the current section"""
+    for handler in _log.handlers:
+        handler.flush()
+
 
 def test_jwt_configuration():
     """Check JWT token configuration"""
-    
-    print("=" * 60)
-    print("JWT TOKEN CONFIGURATION CHECK")
-    print("=" * 60)
-    print()
+    # Load settings on first use (not at import) and read the publication list once
+    from config import settings
+    publications = settings.HASHNODE_PUBLICATIONS
+
+    _log.info("=" * 60)
+    _log.info("JWT TOKEN CONFIGURATION CHECK")
+    _log.info("=" * 60)
+    _log.info("")
     
     # Check publications
-    print(f"📚 Found {len(settings.HASHNODE_PUBLICATIONS)} publications:")
-    print()
+    _log.info(f"📚 Found {len(publications)} publications:")
+    _log.info("")
     
-    for pub in settings.HASHNODE_PUBLICATIONS:
-        print(f"Publication: {pub.name}")
-        print(f"  ├─ API Token: {'✓ Set' if pub.api_token else '✗ Missing'}")
-        print(f"  ├─ Publication ID: {'✓ Set' if pub.publication_id else '✗ Missing'}")
+    jwt_count = 0
+    total_count = 0
+    for pub in publications:
+        total_count += 1
+        jwt_count += bool(pub.jwt_token)
+        _log.info(f"Publication: {pub.name}")
+        _log.info(f"  ├─ API Token: {'✓ Set' if pub.api_token else '✗ Missing'}")
+        _log.info(f"  ├─ Publication ID: {'✓ Set' if pub.publication_id else '✗ Missing'}")
         
         if pub.jwt_token:
             token_preview = pub.jwt_token[:20] + "..." if len(pub.jwt_token) > 20 else pub.jwt_token
-            print(f"  └─ JWT Token: ✓ Set ({token_preview})")
-            print(f"     └─ Length: {len(pub.jwt_token)} characters")
+            _log.info(f"  └─ JWT Token: ✓ Set ({token_preview})")
+            _log.info(f"     └─ Length: {len(pub.jwt_token)} characters")
         else:
-            print(f"  └─ JWT Token: ✗ Not configured")
-            print(f"     └─ Images will use S3 only")
-        print()
+            _log.info(f"  └─ JWT Token: ✗ Not configured")
+            _log.info(f"     └─ Images will use S3 only")
+        _log.info("")
     
+    _flush_section()
+
     # Summary
-    print("=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    
-    jwt_count = sum(1 for pub in settings.HASHNODE_PUBLICATIONS if pub.jwt_token)
-    total_count = len(settings.HASHNODE_PUBLICATIONS)
+    _log.info("=" * 60)
+    _log.info("SUMMARY")
+    _log.info("=" * 60)
     
     if jwt_count == total_count:
-        print("✅ All publications have JWT tokens configured!")
-        print("   Your system will upload to both S3 and Hashnode CDN.")
+        _log.info("✅ All publications have JWT tokens configured!")
+        _log.info("   Your system will upload to both S3 and Hashnode CDN.")
         return True
     elif jwt_count > 0:
-        print(f"⚠️  Only {jwt_count}/{total_count} publications have JWT tokens.")
-        print("   Some publications will use S3 only.")
+        _log.info(f"⚠️  Only {jwt_count}/{total_count} publications have JWT tokens.")
+        _log.info("   Some publications will use S3 only.")
         return True
     else:
-        print("ℹ️  No JWT tokens configured.")
-        print("   All images will upload to S3 only (this works fine!).")
-        print()
-        print("To enable Hashnode CDN uploads:")
-        print("  1. See: docs/GET_JWT_TOKEN.md")
-        print("  2. Or: QUICK_START.md")
+        _log.info("ℹ️  No JWT tokens configured.")
+        _log.info("   All images will upload to S3 only (this works fine!).")
+        _log.info("")
+        _log.info("To enable Hashnode CDN uploads:")
+        _log.info("  1. See: docs/GET_JWT_TOKEN.md")
+        _log.info("  2. Or: QUICK_START.md")
         return True
 
 if __name__ == "__main__":
     try:
         success = test_jwt_configuration()
+        _flush_section()
         sys.exit(0 if success else 1)
     except Exception as e:
-        print(f"❌ Error: {e}")
+        _log.error(f"❌ Error: {e}")
         sys.exit(1)